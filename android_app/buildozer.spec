@@ -3,7 +3,11 @@ title = NTRLI AI
 package.name = ntrliai
 package.domain = com.ntrli
 source.dir = .
-source.include_exts = py,png,jpg,jpeg,ttf,json
+# Ship precompiled bytecode instead of sources: run `python prebuild.py`
+# before building so .pyc files exist and the .py originals are removed.
+# The on-device interpreter then skips parse/compile at every cold start.
+source.include_exts = py,pyc,png,jpg,jpeg,ttf,json
+source.exclude_patterns = prebuild.py
 version = 1.0.0
 
 # Minimal requirements for reliable build
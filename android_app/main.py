@@ -14,16 +14,22 @@ This is a SELF-CONTAINED application following NTRLI' AI principles:
 All core logic is embedded to ensure the APK runs independently.
 """
 
+# PEP 563: annotations stay strings, so the typing module never loads -
+# it costs tens of milliseconds of Android cold-start for nothing at runtime
+from __future__ import annotations
+
 import os
+import re
+import ast
 import sys
 import json
+import time
 import hashlib
+import sqlite3
 import threading
-import traceback
 from pathlib import Path
-from functools import partial
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache, partial
 
 # ============================================================================
 # KIVY CONFIGURATION - MUST BE BEFORE IMPORTS
@@ -38,22 +44,20 @@ Config.set('kivy', 'log_enable', '0')
 
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.screenmanager import ScreenManager, Screen, NoTransition
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
 from kivy.uix.label import Label
-from kivy.uix.spinner import Spinner
-from kivy.uix.switch import Switch
-from kivy.uix.popup import Popup
-from kivy.uix.tabbedpanel import TabbedPanel, TabbedPanelItem
-from kivy.uix.progressbar import ProgressBar
 from kivy.clock import Clock, mainthread
-from kivy.core.clipboard import Clipboard
-from kivy.properties import StringProperty, BooleanProperty, NumericProperty
+from kivy.lang import Builder
+from kivy.properties import StringProperty, BooleanProperty, NumericProperty, ListProperty
 from kivy.utils import platform
 from kivy.logger import Logger
 
+# Heavy widgets (Spinner, Popup, TabbedPanel, ProgressBar, Clipboard) are
+# imported lazily at first use - each one pulls in extra Kivy submodules
+# that dominate cold-start import time on Android.
+
 # ============================================================================
 # EMBEDDED CORE - NO EXTERNAL DEPENDENCIES
 # ============================================================================
@@ -89,91 +93,139 @@ def validate_capability(name: str) -> bool:
 
 # Embedded knowledge cache
 class KnowledgeCache:
-    """Local knowledge cache for offline resilience."""
+    """Local knowledge cache for offline resilience (single SQLite store)."""
 
     def __init__(self, cache_dir: str):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # One file, one fd - avoids per-entry open/fsync on Android storage.
+        # WAL batches durability; the lock covers cross-thread access from
+        # the execute worker and the Settings screen.
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / "cache.db"),
+            check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv (k TEXT PRIMARY KEY, v TEXT, ts REAL)"
+        )
+        self._conn.commit()
 
     def _hash_key(self, key: str) -> str:
-        return hashlib.sha256(key.encode()).hexdigest()[:16]
+        # BLAKE2b sized to exactly the 16 hex chars we keep - cheaper per
+        # byte than SHA-256 on ARM cores without the SHA extension, and no
+        # computed-then-discarded digest tail
+        return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
 
     def store(self, key: str, data: Any) -> None:
         """Store data in cache."""
         try:
-            path = self.cache_dir / f"{self._hash_key(key)}.json"
-            path.write_text(json.dumps({
-                "key": key,
-                "data": data,
-                "timestamp": datetime.utcnow().isoformat()
-            }))
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO kv (k, v, ts) VALUES (?, ?, ?)",
+                    (
+                        self._hash_key(key),
+                        json.dumps(data),
+                        time.time()
+                    )
+                )
+                self._conn.commit()
         except Exception:
             pass  # Cache failures are non-fatal
 
     def load(self, key: str) -> Optional[Any]:
         """Load data from cache."""
         try:
-            path = self.cache_dir / f"{self._hash_key(key)}.json"
-            if path.exists():
-                return json.loads(path.read_text())["data"]
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT v FROM kv WHERE k = ?",
+                    (self._hash_key(key),)
+                ).fetchone()
+            if row:
+                return json.loads(row[0])
         except Exception:
             pass
         return None
 
     def clear(self) -> int:
         """Clear cache, return count of items cleared."""
-        count = 0
-        for f in self.cache_dir.glob("*.json"):
-            try:
-                f.unlink()
-                count += 1
-            except Exception:
-                pass
-        return count
+        try:
+            with self._lock:
+                cursor = self._conn.execute("DELETE FROM kv")
+                self._conn.commit()
+                return cursor.rowcount
+        except Exception:
+            return 0
 
 
 # Embedded HTTP client with retry
 class HTTPClient:
-    """Minimal HTTP client with retry logic."""
+    """Minimal HTTP client backed by a single shared, pooled session."""
 
     MAX_RETRIES = 2
     TIMEOUT = 30
 
-    def __init__(self):
-        self._session = None
+    # One session for the whole process so TCP/TLS connections are reused
+    # across providers and retries instead of handshaking per call.
+    _session = None
+    _session_lock = threading.Lock()
 
     @property
     def session(self):
-        if self._session is None:
-            try:
-                import requests
-                self._session = requests.Session()
-                self._session.headers.update({
-                    "User-Agent": "NTRLI-AI/1.0 (Android)",
-                    "Accept": "application/json",
-                })
-            except ImportError:
-                raise ProviderError("requests library not available")
-        return self._session
+        if HTTPClient._session is None:
+            with HTTPClient._session_lock:
+                if HTTPClient._session is None:
+                    HTTPClient._session = self._create_session()
+        return HTTPClient._session
+
+    @staticmethod
+    def _create_session():
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+        except ImportError:
+            raise ProviderError("requests library not available")
+
+        session = requests.Session()
+        session.headers.update({
+            "User-Agent": "NTRLI-AI/1.0 (Android)",
+            "Accept": "application/json",
+        })
+
+        # Retries handled at the urllib3 layer (allowed_methods=None so
+        # POSTs are retried, matching the previous manual loop)
+        retry = Retry(
+            total=HTTPClient.MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=None,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def post(self, url: str, data: Dict, headers: Optional[Dict] = None) -> Dict:
-        """POST with retry logic."""
-        last_error = None
-        for attempt in range(self.MAX_RETRIES + 1):
-            try:
-                resp = self.session.post(
-                    url,
-                    json=data,
-                    headers=headers or {},
-                    timeout=self.TIMEOUT
-                )
-                resp.raise_for_status()
-                return resp.json()
-            except Exception as e:
-                last_error = e
-                if attempt < self.MAX_RETRIES:
-                    continue
-        raise ProviderError(f"Request failed after {self.MAX_RETRIES + 1} attempts: {last_error}")
+        """POST with pooled connection and automatic retry."""
+        try:
+            resp = self.session.post(
+                url,
+                json=data,
+                headers=headers or {},
+                timeout=self.TIMEOUT
+            )
+            resp.raise_for_status()
+            return resp.json()
+        except ProviderError:
+            raise
+        except Exception as e:
+            raise ProviderError(f"Request failed after {self.MAX_RETRIES + 1} attempts: {e}")
 
 
 # Embedded LLM providers
@@ -181,6 +233,14 @@ class BaseProvider:
     """Base LLM provider."""
     name = "base"
 
+    # Bounded memo of deterministic generations shared by all providers,
+    # keyed by (provider, model, prompt hash). Providers run at
+    # temperature 0, so identical prompts produce identical output and
+    # a repeat call is a wasted HTTP roundtrip.
+    _MEMO_MAX = 256
+    _memo = OrderedDict()
+    _memo_lock = threading.Lock()
+
     def __init__(self, api_key: str, model: str):
         self.api_key = api_key
         self.model = model
@@ -189,6 +249,26 @@ class BaseProvider:
     def generate(self, prompt: str) -> str:
         raise NotImplementedError
 
+    def generate_cached(self, prompt: str) -> str:
+        """Generate with memoization - repeat prompts skip the HTTP call."""
+        key = (
+            self.name,
+            self.model,
+            hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        )
+        with BaseProvider._memo_lock:
+            if key in BaseProvider._memo:
+                BaseProvider._memo.move_to_end(key)
+                return BaseProvider._memo[key]
+
+        result = self.generate(prompt)
+
+        with BaseProvider._memo_lock:
+            BaseProvider._memo[key] = result
+            if len(BaseProvider._memo) > self._MEMO_MAX:
+                BaseProvider._memo.popitem(last=False)
+        return result
+
 
 class OpenAIProvider(BaseProvider):
     """OpenAI provider."""
@@ -258,6 +338,10 @@ def create_provider(name: str, api_key: str, model: Optional[str] = None) -> Bas
     return cls(api_key, model or default_model)
 
 
+# Matches a fenced ```json ... ``` block, compiled once for all plans
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
 # Embedded planner
 class Planner:
     """Plan-first execution planner."""
@@ -272,24 +356,30 @@ Task: {instruction}
 
 Format: {{"steps": [{{"action": "...", "description": "..."}}]}}"""
 
-    def __init__(self, provider: BaseProvider):
+    def __init__(self, provider: BaseProvider, cache: Optional[KnowledgeCache] = None):
         self.provider = provider
+        self.cache = cache
 
     def plan(self, instruction: str) -> List[Dict]:
         """Generate execution plan."""
+        # Plans are deterministic per instruction - reuse a cached one
+        if self.cache:
+            cached = self.cache.load(f"plan:{instruction}")
+            if cached:
+                return cached
+
         prompt = self.PLAN_PROMPT.format(instruction=instruction)
-        response = self.provider.generate(prompt)
+        response = self.provider.generate_cached(prompt)
 
-        # Extract JSON
+        # Extract JSON (single-pass fenced-block match, no substring copies)
         try:
-            # Handle markdown code blocks
-            if "```json" in response:
-                response = response.split("```json")[1].split("```")[0]
-            elif "```" in response:
-                response = response.split("```")[1].split("```")[0]
+            match = _FENCE_RE.search(response)
+            payload = match.group(1) if match else response.strip()
 
-            data = json.loads(response.strip())
+            data = json.loads(payload)
             if "steps" in data and isinstance(data["steps"], list):
+                if self.cache:
+                    self.cache.store(f"plan:{instruction}", data["steps"])
                 return data["steps"]
         except (json.JSONDecodeError, KeyError, IndexError):
             pass
@@ -298,6 +388,13 @@ Format: {{"steps": [{{"action": "...", "description": "..."}}]}}"""
         return [{"action": "execute", "description": instruction}]
 
 
+# Memoized syntax checks keyed by source hash - identical sources repeat
+# during iterate-fix loops and only the first one should pay the parse
+_SYNTAX_MEMO_MAX = 64
+_syntax_memo = OrderedDict()
+_syntax_memo_lock = threading.Lock()
+
+
 # Embedded executor
 class Executor:
     """Step executor with validation."""
@@ -307,7 +404,7 @@ class Executor:
         self.cache = cache
 
     def execute(self, instruction: str, steps: List[Dict]) -> Dict:
-        """Execute plan steps."""
+        """Execute plan steps (independent steps run concurrently)."""
         results = {
             "instruction": instruction,
             "steps_total": len(steps),
@@ -317,20 +414,30 @@ class Executor:
             "error": None
         }
 
-        for i, step in enumerate(steps):
-            try:
-                action = step.get("action", "execute")
-                description = step.get("description", "")
-
-                # Execute based on action type
-                if action == "research":
-                    output = self._research(description)
-                elif action == "generate":
-                    output = self._generate(description)
-                elif action == "validate":
-                    output = self._validate(description)
-                else:
-                    output = self._execute(description)
+        if not steps:
+            return results
+
+        # Each step consumes only its own description, so steps are
+        # independent of each other - fan the provider calls out on a
+        # small pool and collect results in plan order. N sequential
+        # network waits collapse to roughly max(latency).
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(
+            max_workers=min(4, len(steps)),
+            thread_name_prefix="ntrli-step"
+        ) as pool:
+            futures = [pool.submit(self._run_step, step) for step in steps]
+
+            for i, future in enumerate(futures):
+                try:
+                    action, output = future.result()
+                except Exception as e:
+                    results["success"] = False
+                    results["error"] = f"Step {i + 1} failed: {str(e)}"
+                    for pending in futures[i + 1:]:
+                        pending.cancel()
+                    break
 
                 results["outputs"].append({
                     "step": i + 1,
@@ -339,13 +446,24 @@ class Executor:
                 })
                 results["steps_executed"] = i + 1
 
-            except Exception as e:
-                results["success"] = False
-                results["error"] = f"Step {i + 1} failed: {str(e)}"
-                break
-
         return results
 
+    def _run_step(self, step: Dict) -> tuple:
+        """Run a single step, dispatching on its action type."""
+        action = step.get("action", "execute")
+        description = step.get("description", "")
+
+        if action == "research":
+            output = self._research(description)
+        elif action == "generate":
+            output = self._generate(description)
+        elif action == "validate":
+            output = self._validate(description)
+        else:
+            output = self._execute(description)
+
+        return action, output
+
     def _research(self, query: str) -> str:
         # Check cache first
         cached = self.cache.load(f"research:{query}")
@@ -353,41 +471,137 @@ class Executor:
             return f"[Cached] {cached}"
 
         prompt = f"Research and summarize: {query}"
-        result = self.provider.generate(prompt)
+        result = self.provider.generate_cached(prompt)
         self.cache.store(f"research:{query}", result[:500])
         return result
 
     def _generate(self, spec: str) -> str:
         prompt = f"Generate code for: {spec}"
-        return self.provider.generate(prompt)
+        return self.provider.generate_cached(prompt)
 
     def _validate(self, code: str) -> str:
+        key = hashlib.blake2b(code.encode(), digest_size=8).digest()
+        with _syntax_memo_lock:
+            cached = _syntax_memo.get(key)
+            if cached is not None:
+                _syntax_memo.move_to_end(key)
+                return cached
+
+        # ast.parse is the lex+parse portion only - bytecode emission from
+        # a full compile() would be thrown away here
         try:
-            compile(code, "<string>", "exec")
-            return "Validation passed: syntax OK"
+            ast.parse(code)
+            result = "Validation passed: syntax OK"
         except SyntaxError as e:
-            return f"Validation failed: {e}"
+            result = f"Validation failed: {e}"
+
+        with _syntax_memo_lock:
+            _syntax_memo[key] = result
+            if len(_syntax_memo) > _SYNTAX_MEMO_MAX:
+                _syntax_memo.popitem(last=False)
+        return result
 
     def _execute(self, instruction: str) -> str:
         prompt = f"Execute this task and provide the result: {instruction}"
-        return self.provider.generate(prompt)
+        return self.provider.generate_cached(prompt)
 
 
 # ============================================================================
 # ANDROID APP UI
 # ============================================================================
 
+# Cap what a single step contributes to the on-screen JSON dump - the
+# output widget can only show a screenful, so pushing megabytes at it
+# just burns UI-thread time and memory
+_MAX_STEP_OUTPUT = 8192
+
+# Hoisted user-facing error strings (constructed once, not per click)
+_ERR_NO_INSTRUCTION = "Please enter an instruction"
+
+# Collapses any whitespace run (incl. newlines) for one-line status text
+_WS_RE = re.compile(r"\s+")
+
+# One app-wide toast popup, created lazily on first use and reused: the
+# label is retitled per call instead of building a Popup per toast
+_toast_popup = None
+_toast_label = None
+_toast_event = None
+
+
+def _show_toast(msg: str):
+    """Show a transient toast message (auto-dismissed after 1.2s)."""
+    global _toast_popup, _toast_label, _toast_event
+    if _toast_popup is None:
+        from kivy.uix.popup import Popup
+        _toast_label = Label(text=msg)
+        _toast_popup = Popup(
+            title="",
+            content=_toast_label,
+            size_hint=(0.5, 0.15),
+            auto_dismiss=True
+        )
+    _toast_label.text = msg
+    if _toast_event is not None:
+        Clock.unschedule(_toast_event)
+    _toast_popup.open()
+    # dismiss() ignores extra args, so the bound method schedules directly
+    # with no wrapper lambda allocated per toast
+    _toast_event = Clock.schedule_once(_toast_popup.dismiss, 1.2)
+
+# Providers exposed in the UI, with their config-key strings precomputed
+# so hot paths don't rebuild the same f-string per call
+_PROVIDERS = ("groq", "openai", "deepseek")
+_API_KEY_PATHS = {p: f"api_keys.{p}" for p in _PROVIDERS}
+
+# Environment overrides: (env var, config key) built once at import
+_ENV_TO_CONFIG_KEY = tuple(
+    (f"{p.upper()}_API_KEY", _API_KEY_PATHS[p]) for p in _PROVIDERS
+)
+
+_INV_255 = 1 / 255.0
+
+
+@lru_cache(maxsize=32)
+def _hex_to_rgba(hex_color: str) -> tuple:
+    """Parse '#RRGGBB' to a Kivy RGBA tuple, memoized per color string."""
+    value = int(hex_color[1:], 16)
+    return (
+        ((value >> 16) & 0xFF) * _INV_255,
+        ((value >> 8) & 0xFF) * _INV_255,
+        (value & 0xFF) * _INV_255,
+        1
+    )
+
+
+def _truncate_step_outputs(result: Dict) -> Dict:
+    """Copy an executor result with long step outputs capped for display."""
+    outputs = []
+    for item in result.get("outputs", []):
+        output = item.get("output")
+        if isinstance(output, str) and len(output) > _MAX_STEP_OUTPUT:
+            item = {**item, "output": output[:_MAX_STEP_OUTPUT] + " ... [truncated]"}
+        outputs.append(item)
+    return {**result, "outputs": outputs}
+
+# Status palette, pre-converted to Kivy RGBA so state changes assign a
+# tuple instead of parsing a hex string per update
+_COLOR_READY = _hex_to_rgba("#4CAF50")
+_COLOR_RUNNING = _hex_to_rgba("#FFC107")
+_COLOR_SUCCESS = _COLOR_READY
+_COLOR_ERROR = _hex_to_rgba("#F44336")
+
+
 class StatusBar(BoxLayout):
     """Status bar with connection indicator."""
 
     status_text = StringProperty("Ready")
-    status_color = StringProperty("#4CAF50")
+    status_color = ListProperty(_COLOR_READY)
 
     def __init__(self, **kwargs):
         super().__init__(size_hint_y=None, height=40, **kwargs)
         self.label = Label(
             text=self.status_text,
-            color=(0.3, 0.7, 0.3, 1),
+            color=self.status_color,
             bold=True
         )
         self.add_widget(self.label)
@@ -396,152 +610,252 @@ class StatusBar(BoxLayout):
 
     def _update(self, *args):
         self.label.text = self.status_text
-        # Parse hex color
-        if self.status_color.startswith("#"):
-            hex_color = self.status_color[1:]
-            r = int(hex_color[0:2], 16) / 255
-            g = int(hex_color[2:4], 16) / 255
-            b = int(hex_color[4:6], 16) / 255
-            self.label.color = (r, g, b, 1)
+        self.label.color = self.status_color
+
+    def set_status_hex(self, hex_color: str):
+        """Set a custom status color from a '#RRGGBB' string."""
+        self.status_color = _hex_to_rgba(hex_color)
 
     def set_ready(self):
         self.status_text = "Ready"
-        self.status_color = "#4CAF50"
+        self.status_color = _COLOR_READY
 
     def set_running(self):
         self.status_text = "Executing..."
-        self.status_color = "#FFC107"
+        self.status_color = _COLOR_RUNNING
 
     def set_success(self):
         self.status_text = "Complete"
-        self.status_color = "#4CAF50"
+        self.status_color = _COLOR_SUCCESS
 
     def set_error(self, msg: str = "Error"):
-        self.status_text = msg[:30]
-        self.status_color = "#F44336"
+        # Flatten to a single line before truncating so a leading
+        # traceback newline can't blank out the visible 30 chars
+        self.status_text = _WS_RE.sub(" ", msg)[:30]
+        self.status_color = _COLOR_ERROR
+
+
+class OutputPanel(BoxLayout):
+    """
+    Virtualized output panel.
+
+    Backed by a RecycleView of per-line labels: only the lines actually on
+    screen allocate textures, so multi-thousand-line outputs stay cheap to
+    hold and smooth to scroll.
 
+    Content is keyed by named sections: a producer can rewrite one section
+    (e.g. a status line) without resending everything else, and the
+    expensive data rebuild is coalesced behind a single clock trigger.
+    """
 
-class OutputPanel(ScrollView):
-    """Scrollable output panel."""
+    # Coalescing window for refreshes and cap on rendered lines
+    FLUSH_INTERVAL = 0.05
+    MAX_LINES = 5000
+
+    DEFAULT_SECTION = "log"
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.label = Label(
-            text="",
-            size_hint_y=None,
-            halign="left",
-            valign="top",
-            markup=True,
-            text_size=(None, None),
-            padding=(10, 10)
+        from kivy.uix.recycleview import RecycleView
+        from kivy.uix.recycleboxlayout import RecycleBoxLayout
+        from kivy.metrics import dp
+
+        self.view = RecycleView()
+        self.view.viewclass = "Label"
+        layout = RecycleBoxLayout(
+            orientation="vertical",
+            default_size_hint=(1, None),
+            default_size=(None, dp(20)),
+            size_hint_y=None
+        )
+        layout.bind(minimum_height=layout.setter("height"))
+        self.view.add_widget(layout)
+        self.add_widget(self.view)
+
+        # Section name -> list of lines, rendered in first-write order
+        self._sections = {}
+        self._order = []
+        self._refresh_trigger = Clock.create_trigger(
+            self._refresh, self.FLUSH_INTERVAL
         )
-        self.label.bind(texture_size=self._update_size)
-        self.add_widget(self.label)
 
-    def _update_size(self, *args):
-        self.label.size = self.label.texture_size
-        self.label.text_size = (self.width - 20, None)
+    @property
+    def text(self) -> str:
+        return "\n".join(
+            line for name in self._order for line in self._sections[name]
+        )
+
+    def set_section(self, name: str, text: str):
+        """Replace one section's content, leaving the others in place."""
+        if name not in self._sections:
+            self._order.append(name)
+        self._sections[name] = text.split("\n")
+        self._refresh_trigger()
+
+    def append_section(self, name: str, text: str):
+        """Append to one section; a chunk may continue its last line."""
+        lines = self._sections.get(name)
+        if lines is None:
+            self.set_section(name, text)
+            return
+        new_lines = text.split("\n")
+        lines[-1] += new_lines[0]
+        lines.extend(new_lines[1:])
+        self._refresh_trigger()
 
     def set_text(self, text: str):
-        self.label.text = text
-        self.scroll_y = 1  # Scroll to top
+        self.clear()
+        self.set_section(self.DEFAULT_SECTION, text)
 
     def append_text(self, text: str):
-        self.label.text += text
-        self.scroll_y = 0  # Scroll to bottom
+        self.append_section(self.DEFAULT_SECTION, text)
+
+    def _refresh(self, *args):
+        lines = [
+            line for name in self._order for line in self._sections[name]
+        ]
+        if len(lines) > self.MAX_LINES:
+            del lines[:len(lines) - self.MAX_LINES]
+        self.view.data = [{"text": line} for line in lines]
+        self.view.scroll_y = 0
 
     def clear(self):
-        self.label.text = ""
+        self._refresh_trigger.cancel()
+        self._sections.clear()
+        self._order.clear()
+        self.view.data = []
+
+
+# Static screen layouts, compiled once by the KV parser instead of being
+# rebuilt attribute-by-attribute in Python per instance. Spinner and
+# ProgressBar are resolved lazily through the Factory at first apply, so
+# the module-level lazy-import policy still holds.
+_SCREENS_KV = """
+<ExecuteScreen>:
+    orientation: "vertical"
+    padding: 10
+    spacing: 8
+    BoxLayout:
+        size_hint_y: None
+        height: 50
+        Label:
+            text: "[b]NTRLI' AI[/b]"
+            markup: True
+            font_size: "22sp"
+    StatusBar:
+        id: status
+    TextInput:
+        id: instruction_input
+        hint_text: "Enter instruction..."
+        multiline: True
+        size_hint_y: None
+        height: 100
+        font_size: "16sp"
+    BoxLayout:
+        size_hint_y: None
+        height: 44
+        spacing: 8
+        Label:
+            text: "Provider:"
+            size_hint_x: 0.25
+        Spinner:
+            id: provider_spinner
+            text: "groq"
+            size_hint_x: 0.75
+    Button:
+        id: execute_btn
+        text: "EXECUTE"
+        size_hint_y: None
+        height: 50
+        font_size: "18sp"
+        background_color: 0.2, 0.5, 0.8, 1
+        bold: True
+        on_press: root.on_execute(self)
+    ProgressBar:
+        id: progress
+        max: 100
+        value: 0
+        size_hint_y: None
+        height: 8
+    Label:
+        text: "Output:"
+        size_hint_y: None
+        height: 25
+    OutputPanel:
+        id: output
+    BoxLayout:
+        size_hint_y: None
+        height: 44
+        spacing: 8
+        Button:
+            text: "Copy"
+            on_press: root.on_copy(self)
+        Button:
+            text: "Cancel"
+            on_press: root.on_cancel(self)
+        Button:
+            text: "Clear"
+            on_press: root.on_clear(self)
+
+<SettingsScreen>:
+    orientation: "vertical"
+    padding: 10
+    spacing: 8
+    Label:
+        text: "[b]Settings[/b]"
+        markup: True
+        size_hint_y: None
+        height: 40
+        font_size: "20sp"
+    ScrollView:
+        GridLayout:
+            id: settings_grid
+            cols: 1
+            spacing: 10
+            size_hint_y: None
+            height: self.minimum_height
+    Button:
+        text: "Save Settings"
+        size_hint_y: None
+        height: 50
+        background_color: 0.2, 0.6, 0.2, 1
+        on_press: root.on_save(self)
+"""
+
+Builder.load_string(_SCREENS_KV)
 
 
 class ExecuteScreen(BoxLayout):
-    """Main execution screen."""
+    """Main execution screen (layout declared in _SCREENS_KV)."""
 
     def __init__(self, app, **kwargs):
-        super().__init__(orientation="vertical", padding=10, spacing=8, **kwargs)
+        super().__init__(**kwargs)
         self.app = app
-        self._running = False
-
-        # Header
-        header = BoxLayout(size_hint_y=None, height=50)
-        header.add_widget(Label(
-            text="[b]NTRLI' AI[/b]",
-            markup=True,
-            font_size="22sp"
-        ))
-        self.add_widget(header)
-
-        # Status bar
-        self.status = StatusBar()
-        self.add_widget(self.status)
-
-        # Instruction input
-        self.input = TextInput(
-            hint_text="Enter instruction...",
-            multiline=True,
-            size_hint_y=None,
-            height=100,
-            font_size="16sp"
-        )
-        self.add_widget(self.input)
-
-        # Provider selector
-        provider_box = BoxLayout(size_hint_y=None, height=44, spacing=8)
-        provider_box.add_widget(Label(text="Provider:", size_hint_x=0.25))
-        self.provider_spinner = Spinner(
-            text="groq",
-            values=["groq", "openai", "deepseek"],
-            size_hint_x=0.75
-        )
-        provider_box.add_widget(self.provider_spinner)
-        self.add_widget(provider_box)
-
-        # Execute button
-        self.execute_btn = Button(
-            text="EXECUTE",
-            size_hint_y=None,
-            height=50,
-            font_size="18sp",
-            background_color=(0.2, 0.5, 0.8, 1),
-            bold=True
-        )
-        self.execute_btn.bind(on_press=self.on_execute)
-        self.add_widget(self.execute_btn)
-
-        # Progress bar
-        self.progress = ProgressBar(
-            max=100,
-            value=0,
-            size_hint_y=None,
-            height=8
-        )
-        self.add_widget(self.progress)
-
-        # Output panel
-        self.add_widget(Label(text="Output:", size_hint_y=None, height=25))
-        self.output = OutputPanel()
-        self.add_widget(self.output)
-
-        # Bottom buttons
-        btn_box = BoxLayout(size_hint_y=None, height=44, spacing=8)
-
-        copy_btn = Button(text="Copy")
-        copy_btn.bind(on_press=self.on_copy)
-        btn_box.add_widget(copy_btn)
-
-        clear_btn = Button(text="Clear")
-        clear_btn.bind(on_press=self.on_clear)
-        btn_box.add_widget(clear_btn)
-
-        self.add_widget(btn_box)
+        # Events instead of bare bools: the worker thread can observe a
+        # cancel request mid-run without racing the main thread
+        self._running = threading.Event()
+        self._cancelled = threading.Event()
+        self._current_future = None
+        # UI updates queued by the worker, applied in one main-thread flush
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+
+        # Wire up the KV-built widgets
+        self.status = self.ids.status
+        self.input = self.ids.instruction_input
+        self.provider_spinner = self.ids.provider_spinner
+        self.provider_spinner.values = list(_PROVIDERS)
+        self.execute_btn = self.ids.execute_btn
+        self.progress = self.ids.progress
+        self.output = self.ids.output
 
     def on_execute(self, btn):
-        if self._running:
+        if self._running.is_set():
             return
 
         instruction = self.input.text.strip()
         if not instruction:
-            self.show_error("Please enter an instruction")
+            self.show_error(_ERR_NO_INSTRUCTION)
             return
 
         provider_name = self.provider_spinner.text
@@ -551,91 +865,126 @@ class ExecuteScreen(BoxLayout):
             self.show_error(f"No API key for {provider_name}")
             return
 
-        self._running = True
+        self._running.set()
+        self._cancelled.clear()
         self.execute_btn.disabled = True
         self.status.set_running()
         self.output.clear()
         self.progress.value = 10
 
-        # Run in background
-        thread = threading.Thread(
-            target=self._execute_bg,
-            args=(instruction, provider_name, api_key),
-            daemon=True
+        # Run on the shared worker pool
+        future = self.app.get_worker_pool().submit(
+            self._execute_bg, instruction, provider_name, api_key
         )
-        thread.start()
+        future.add_done_callback(self._finish)
+        self._current_future = future
 
     def _execute_bg(self, instruction: str, provider_name: str, api_key: str):
         """Background execution."""
         try:
-            # Create provider
-            provider = create_provider(provider_name, api_key)
-            self._update_progress(20)
+            # Reuse the provider instance for this name/key pair
+            provider = self.app.get_provider(provider_name, api_key)
+            self._post_ui(progress=20)
 
             # Create planner and executor
-            planner = Planner(provider)
-            cache = KnowledgeCache(self.app.get_cache_dir())
+            cache = self.app.get_knowledge_cache()
+            planner = Planner(provider, cache)
             executor = Executor(provider, cache)
 
-            # Plan
-            self._append_output("[Planning...]\n")
+            # Plan - progress lines live in their own section, so the
+            # result never has to clear and resend them
+            self._post_ui(set_section=("status", "[Planning...]"))
             steps = planner.plan(instruction)
-            self._update_progress(40)
-            self._append_output(f"Plan: {len(steps)} steps\n\n")
+            if self._cancelled.is_set():
+                return
+            self._post_ui(
+                progress=40,
+                set_section=("status", f"[Executing...] Plan: {len(steps)} steps\n")
+            )
 
             # Execute
-            self._append_output("[Executing...]\n")
             result = executor.execute(instruction, steps)
-            self._update_progress(90)
+            if self._cancelled.is_set():
+                return
+            self._post_ui(progress=90)
 
-            # Format output
-            output = json.dumps(result, indent=2, default=str)
-            self._set_output(output)
-            self._update_progress(100)
+            # Stream the encoder output instead of materializing the whole
+            # pretty-printed blob - chunks ride the panel's coalescing
+            # buffer, capping peak memory at one chunk
+            encoder = json.JSONEncoder(indent=2, default=str)
+            for chunk in encoder.iterencode(_truncate_step_outputs(result)):
+                self._post_ui(append_section=("result", chunk))
 
             if result["success"]:
-                self._set_status_success()
+                status = ("success",)
             else:
-                self._set_status_error(result.get("error", "Failed"))
+                status = ("error", result.get("error", "Failed"))
+            self._post_ui(progress=100, status=status)
 
         except Exception as e:
-            error_msg = f"Error: {str(e)}"
+            # Cap at source: provider errors can embed whole response
+            # bodies, and the full text is already in the log
+            error_msg = f"Error: {str(e)[:200]}"
             Logger.exception("Execution failed")
-            self._set_output(error_msg)
-            self._set_status_error("Execution failed")
-        finally:
-            self._finish()
-
-    @mainthread
-    def _update_progress(self, value: int):
-        self.progress.value = value
-
-    @mainthread
-    def _append_output(self, text: str):
-        self.output.append_text(text)
-
-    @mainthread
-    def _set_output(self, text: str):
-        self.output.set_text(text)
-
-    @mainthread
-    def _set_status_success(self):
-        self.status.set_success()
-
-    @mainthread
-    def _set_status_error(self, msg: str):
-        self.status.set_error(msg)
+            self._post_ui(output=error_msg, status=("error", "Execution failed"))
+
+    def _post_ui(self, **updates):
+        """
+        Queue UI changes from the worker thread.
+
+        Updates accumulate in a dict and one scheduled flush applies them,
+        so a burst of worker events costs a single main-loop wakeup.
+        """
+        with self._pending_lock:
+            schedule = not self._pending
+            if sec := updates.pop("set_section", None):
+                self._pending.setdefault("section_ops", []).append(("set",) + sec)
+            if sec := updates.pop("append_section", None):
+                self._pending.setdefault("section_ops", []).append(("append",) + sec)
+            self._pending.update(updates)
+        if schedule:
+            Clock.schedule_once(self._flush_ui, 0)
+
+    def _flush_ui(self, dt):
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+
+        if "progress" in pending:
+            self.progress.value = pending["progress"]
+        for op, name, text in pending.get("section_ops", ()):
+            if op == "set":
+                self.output.set_section(name, text)
+            else:
+                self.output.append_section(name, text)
+        if "output" in pending:
+            self.output.set_text(pending["output"])
+        if status := pending.get("status"):
+            if status[0] == "success":
+                self.status.set_success()
+            else:
+                self.status.set_error(status[1])
 
     @mainthread
-    def _finish(self):
-        self._running = False
+    def _finish(self, *args):
+        self._running.clear()
         self.execute_btn.disabled = False
 
     def on_copy(self, btn):
-        text = self.output.label.text
+        from kivy.core.clipboard import Clipboard
+
+        text = self.output.text
         if text:
             Clipboard.copy(text)
-            self.show_toast("Copied!")
+            _show_toast("Copied!")
+
+    def on_cancel(self, btn):
+        # Un-started work is dropped from the pool; in-flight work stops
+        # at its next cancellation checkpoint in _execute_bg
+        self._cancelled.set()
+        if self._current_future:
+            self._current_future.cancel()
+        self.status.set_ready()
+        self.progress.value = 0
 
     def on_clear(self, btn):
         self.output.clear()
@@ -644,6 +993,8 @@ class ExecuteScreen(BoxLayout):
         self.status.set_ready()
 
     def show_error(self, msg: str):
+        from kivy.uix.popup import Popup
+
         popup = Popup(
             title="Error",
             content=Label(text=msg),
@@ -651,41 +1002,19 @@ class ExecuteScreen(BoxLayout):
         )
         popup.open()
 
-    def show_toast(self, msg: str):
-        popup = Popup(
-            title="",
-            content=Label(text=msg),
-            size_hint=(0.5, 0.15),
-            auto_dismiss=True
-        )
-        popup.open()
-        Clock.schedule_once(lambda dt: popup.dismiss(), 1.2)
-
 
 class SettingsScreen(BoxLayout):
-    """Settings screen."""
+    """Settings screen (layout declared in _SCREENS_KV)."""
 
     def __init__(self, app, **kwargs):
-        super().__init__(orientation="vertical", padding=10, spacing=8, **kwargs)
+        super().__init__(**kwargs)
         self.app = app
 
-        # Header
-        self.add_widget(Label(
-            text="[b]Settings[/b]",
-            markup=True,
-            size_hint_y=None,
-            height=40,
-            font_size="20sp"
-        ))
-
-        # Scrollable settings
-        scroll = ScrollView()
-        settings = GridLayout(cols=1, spacing=10, size_hint_y=None)
-        settings.bind(minimum_height=settings.setter("height"))
-
-        # API Key inputs
+        # Only the data-driven rows stay in Python: one API-key input per
+        # provider, added into the KV-built grid
+        settings = self.ids.settings_grid
         self.api_inputs = {}
-        for provider in ["groq", "openai", "deepseek"]:
+        for provider in _PROVIDERS:
             box = BoxLayout(orientation="vertical", size_hint_y=None, height=70)
             box.add_widget(Label(
                 text=f"{provider.upper()} API Key:",
@@ -694,7 +1023,7 @@ class SettingsScreen(BoxLayout):
                 halign="left"
             ))
             input_field = TextInput(
-                text=self.app.config.get(f"api_keys.{provider}", ""),
+                text=self.app.config.get(_API_KEY_PATHS[provider], ""),
                 password=True,
                 multiline=False,
                 size_hint_y=None,
@@ -713,40 +1042,17 @@ class SettingsScreen(BoxLayout):
         cache_box.add_widget(clear_cache_btn)
         settings.add_widget(cache_box)
 
-        scroll.add_widget(settings)
-        self.add_widget(scroll)
-
-        # Save button
-        save_btn = Button(
-            text="Save Settings",
-            size_hint_y=None,
-            height=50,
-            background_color=(0.2, 0.6, 0.2, 1)
-        )
-        save_btn.bind(on_press=self.on_save)
-        self.add_widget(save_btn)
-
     def on_key_change(self, provider: str, instance, value: str):
-        self.app.config[f"api_keys.{provider}"] = value
+        self.app.config[_API_KEY_PATHS[provider]] = value
 
     def on_clear_cache(self, btn):
-        cache = KnowledgeCache(self.app.get_cache_dir())
+        cache = self.app.get_knowledge_cache()
         count = cache.clear()
-        self.show_toast(f"Cleared {count} items")
+        _show_toast(f"Cleared {count} items")
 
     def on_save(self, btn):
         self.app.save_config()
-        self.show_toast("Saved!")
-
-    def show_toast(self, msg: str):
-        popup = Popup(
-            title="",
-            content=Label(text=msg),
-            size_hint=(0.5, 0.15),
-            auto_dismiss=True
-        )
-        popup.open()
-        Clock.schedule_once(lambda dt: popup.dismiss(), 1.2)
+        _show_toast("Saved!")
 
 
 class AboutScreen(BoxLayout):
@@ -788,6 +1094,19 @@ This is not a promise.
         ))
 
 
+class LazyScreen(Screen):
+    """Screen that builds its content on first entry."""
+
+    def __init__(self, factory, **kwargs):
+        super().__init__(**kwargs)
+        self._factory = factory
+
+    def on_pre_enter(self, *args):
+        if self._factory is not None:
+            self.add_widget(self._factory())
+            self._factory = None
+
+
 class NTRLIApp(App):
     """NTRLI' AI Android Application."""
 
@@ -796,80 +1115,163 @@ class NTRLIApp(App):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.config = {}
+        self._config_hash = None
+        self._worker_pool = None
+        self._provider_cache = {}
+        self._knowledge_cache = None
+        self._data_dir = None
+        self._config_path = None
+        self._cache_dir = None
         self._load_config()
 
+    def get_worker_pool(self):
+        """Shared background worker pool (created on first use)."""
+        if self._worker_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._worker_pool = ThreadPoolExecutor(
+                max_workers=2,
+                thread_name_prefix="ntrli"
+            )
+        return self._worker_pool
+
+    def get_knowledge_cache(self) -> KnowledgeCache:
+        """Shared knowledge cache (one SQLite connection per process)."""
+        if self._knowledge_cache is None:
+            self._knowledge_cache = KnowledgeCache(self.get_cache_dir())
+        return self._knowledge_cache
+
     def build(self):
         """Build the application."""
-        # Root tabs
-        tabs = TabbedPanel(do_default_tab=False)
+        root = BoxLayout(orientation="vertical")
+
+        # ScreenManager instead of a TabbedPanel: only the current screen
+        # is in the render tree, so idle screens cost nothing per frame
+        self._screens = ScreenManager(transition=NoTransition())
+
+        # Execute - the default view, built eagerly so the first frame
+        # shows real content
+        execute = Screen(name="execute")
+        execute.add_widget(ExecuteScreen(self))
+        self._screens.add_widget(execute)
+
+        # Settings/About defer their widget trees to first entry
+        self._screens.add_widget(
+            LazyScreen(lambda: SettingsScreen(self), name="settings")
+        )
+        self._screens.add_widget(LazyScreen(AboutScreen, name="about"))
+        root.add_widget(self._screens)
+
+        # Bottom tab bar
+        tab_bar = BoxLayout(size_hint_y=None, height=48)
+        for name, text in (
+            ("execute", "Execute"),
+            ("settings", "Settings"),
+            ("about", "About"),
+        ):
+            btn = Button(text=text)
+            btn.bind(on_press=partial(self._switch_screen, name))
+            tab_bar.add_widget(btn)
+        root.add_widget(tab_bar)
+
+        self._warm_font_cache()
 
-        # Execute tab
-        execute_tab = TabbedPanelItem(text="Execute")
-        execute_tab.add_widget(ExecuteScreen(self))
-        tabs.add_widget(execute_tab)
+        return root
 
-        # Settings tab
-        settings_tab = TabbedPanelItem(text="Settings")
-        settings_tab.add_widget(SettingsScreen(self))
-        tabs.add_widget(settings_tab)
+    def _switch_screen(self, name, btn):
+        self._screens.current = name
 
-        # About tab
-        about_tab = TabbedPanelItem(text="About")
-        about_tab.add_widget(AboutScreen())
-        tabs.add_widget(about_tab)
+    # Font sizes used by the app's labels and inputs
+    _FONT_SIZES = ("14sp", "16sp", "18sp", "20sp", "22sp")
 
-        return tabs
+    def _warm_font_cache(self):
+        """
+        Pre-render the glyph set for each font size the UI uses.
+
+        SDL_ttf rasterizes glyphs per font size on first use; rendering an
+        off-screen label per size at startup populates Kivy's glyph cache
+        so the first frames don't stall on rasterization.
+        """
+        import string
+
+        for size in self._FONT_SIZES:
+            label = Label(text=string.printable, font_size=size)
+            label.texture_update()
 
     def get_data_dir(self) -> str:
-        """Get platform-appropriate data directory."""
-        if platform == "android":
-            from android.storage import app_storage_path
-            return app_storage_path()
-        else:
-            return os.path.expanduser("~/.ntrli_ai")
+        """Get platform-appropriate data directory (resolved once)."""
+        if self._data_dir is None:
+            if platform == "android":
+                from android.storage import app_storage_path
+                self._data_dir = app_storage_path()
+            else:
+                self._data_dir = os.path.expanduser("~/.ntrli_ai")
+        return self._data_dir
 
     def get_cache_dir(self) -> str:
-        """Get cache directory."""
-        cache_dir = os.path.join(self.get_data_dir(), "cache")
-        os.makedirs(cache_dir, exist_ok=True)
-        return cache_dir
+        """Get cache directory (created on first call, then cached)."""
+        if self._cache_dir is None:
+            cache_dir = os.path.join(self.get_data_dir(), "cache")
+            os.makedirs(cache_dir, exist_ok=True)
+            self._cache_dir = cache_dir
+        return self._cache_dir
 
     def get_config_path(self) -> str:
-        """Get config file path."""
-        return os.path.join(self.get_data_dir(), "config.json")
+        """Get config file path (resolved once)."""
+        if self._config_path is None:
+            self._config_path = os.path.join(self.get_data_dir(), "config.json")
+        return self._config_path
 
     def _load_config(self):
         """Load configuration."""
         try:
             path = self.get_config_path()
             if os.path.exists(path):
-                with open(path, "r") as f:
+                with open(path, "r", encoding="utf-8") as f:
                     self.config = json.load(f)
         except Exception:
             self.config = {}
 
-        # Also check environment variables
-        env_keys = {
-            "groq": "GROQ_API_KEY",
-            "openai": "OPENAI_API_KEY",
-            "deepseek": "DEEPSEEK_API_KEY",
-        }
-        for provider, env_var in env_keys.items():
-            if env_val := os.getenv(env_var):
-                self.config[f"api_keys.{provider}"] = env_val
+        # Also check environment variables; skip no-op writes so the
+        # config hash still reports "unchanged" afterwards
+        for env_var, cfg_key in _ENV_TO_CONFIG_KEY:
+            if (env_val := os.getenv(env_var)) and self.config.get(cfg_key) != env_val:
+                self.config[cfg_key] = env_val
+
+        self._config_hash = self._hash_config()
+
+    def _hash_config(self) -> str:
+        """Hash the serialized config for change detection."""
+        serialized = json.dumps(self.config, indent=2, sort_keys=True)
+        return hashlib.sha256(serialized.encode()).hexdigest()
 
     def save_config(self):
-        """Save configuration."""
+        """Save configuration (skipped if nothing changed)."""
+        config_hash = self._hash_config()
+        if config_hash == self._config_hash:
+            return  # Unchanged - avoid disk write
+
         try:
             os.makedirs(self.get_data_dir(), exist_ok=True)
-            with open(self.get_config_path(), "w") as f:
+            with open(self.get_config_path(), "w", encoding="utf-8") as f:
                 json.dump(self.config, f, indent=2)
+            self._config_hash = config_hash
+            self._provider_cache.clear()  # Keys may have changed
         except Exception as e:
             Logger.error(f"Failed to save config: {e}")
 
     def get_api_key(self, provider: str) -> Optional[str]:
         """Get API key for provider."""
-        return self.config.get(f"api_keys.{provider}")
+        key_path = _API_KEY_PATHS.get(provider) or f"api_keys.{provider}"
+        return self.config.get(key_path)
+
+    def get_provider(self, name: str, api_key: str) -> BaseProvider:
+        """Get a provider instance, reused across execute clicks."""
+        cache_key = (name, api_key)
+        provider = self._provider_cache.get(cache_key)
+        if provider is None:
+            provider = create_provider(name, api_key)
+            self._provider_cache[cache_key] = provider
+        return provider
 
 
 # ============================================================================
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# ============================================================================
+# NTRLI' AI - APK PRE-BUILD STEP (BYTECODE PACKAGING)
+# ============================================================================
+"""
+Pre-build step for the Android APK: ship .pyc bytecode instead of .py source.
+
+The on-device Python parses every shipped .py file at cold start. Compiling
+to legacy-named bytecode (`compileall -b`) and packaging only the .pyc files
+removes the parse/compile cost from app startup.
+
+Usage (from android_app/, before `buildozer android debug`):
+
+    python prebuild.py
+
+This compiles the app sources in place and removes the .py originals from
+the build staging copy. Run it only inside a CI/build checkout - it deletes
+source files after compiling them.
+"""
+
+import compileall
+import sys
+from pathlib import Path
+
+# Directories bundled into the APK
+SOURCE_DIRS = ["."]
+
+
+def main() -> int:
+    root = Path(__file__).parent
+
+    for source_dir in SOURCE_DIRS:
+        target = root / source_dir
+
+        # -b writes classic foo.pyc next to foo.py so imports resolve
+        # without a __pycache__ lookup
+        ok = compileall.compile_dir(str(target), legacy=True, quiet=1)
+        if not ok:
+            print(f"ERROR: bytecode compilation failed in {target}", file=sys.stderr)
+            return 1
+
+        # Remove sources so only bytecode is packaged
+        for py_file in target.rglob("*.py"):
+            if py_file.name == "prebuild.py":
+                continue
+            py_file.unlink()
+            print(f"compiled + removed: {py_file}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,17 +25,19 @@ If any law is violated, execution halts.
 __version__ = "1.0.0"
 __author__ = "NTRLI AI"
 
-from .capabilities import (
-    assert_capability,
-    list_capabilities,
-    CAPABILITIES,
-)
-
-from .control_plane import ControlPlane
-from .orchestrator import Orchestrator
-from .planner import Planner
-from .step_executor import StepExecutor
-from .failure_recovery import FailureRecovery
+# Public API, resolved lazily (PEP 562): importing the package no longer
+# pulls in the planner/orchestrator stack (and its transitive provider
+# imports) unless the caller actually touches one of these names.
+_LAZY_ATTRS = {
+    "assert_capability": ("capabilities", "assert_capability"),
+    "list_capabilities": ("capabilities", "list_capabilities"),
+    "CAPABILITIES": ("capabilities", "CAPABILITIES"),
+    "ControlPlane": ("control_plane", "ControlPlane"),
+    "Orchestrator": ("orchestrator", "Orchestrator"),
+    "Planner": ("planner", "Planner"),
+    "StepExecutor": ("step_executor", "StepExecutor"),
+    "FailureRecovery": ("failure_recovery", "FailureRecovery"),
+}
 
 __all__ = [
     "ControlPlane",
@@ -47,3 +49,19 @@ __all__ = [
     "list_capabilities",
     "CAPABILITIES",
 ]
+
+
+def __getattr__(name):
+    """Resolve public attributes on first access and cache them."""
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
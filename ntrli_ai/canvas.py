@@ -8,18 +8,28 @@ The canvas holds all state for a single execution session,
 including intermediate results, artifacts, and execution trace.
 """
 
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import sys
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from datetime import datetime, timezone
 from dataclasses import dataclass, field
 
+# Bound once: datetime.now(tz) is faster than the deprecated utcnow()
+# and yields offset-aware stamps; millisecond precision is plenty here
+_UTC = timezone.utc
 
-@dataclass
+
+def _utc_now_iso() -> str:
+    return datetime.now(_UTC).isoformat(timespec="milliseconds")
+
+
+@dataclass(slots=True)
 class CanvasEntry:
     """A single entry in the canvas."""
     key: str
     value: Any
     entry_type: str
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = field(default_factory=_utc_now_iso)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -30,17 +40,28 @@ class Canvas:
     Holds all state for a single execution session.
     """
 
-    def __init__(self, conversation_id: str):
+    def __init__(self, conversation_id: str, fast_timestamps: bool = False):
         """
         Initialize canvas.
 
         Args:
             conversation_id: Unique identifier for this session
+            fast_timestamps: Store entry timestamps as raw time.time_ns()
+                integers (~40x cheaper than ISO formatting) and format
+                them lazily on to_dict() export. Use for sessions that
+                write many entries.
         """
         self.conversation_id = conversation_id
-        self.created_at = datetime.utcnow().isoformat()
+        self.created_at = _utc_now_iso()
+        self._fast_timestamps = fast_timestamps
         self._entries: Dict[str, CanvasEntry] = {}
+        # Secondary index: entry_type -> keys of that type, so filtered
+        # list_keys() scans one bucket instead of every entry
+        self._by_type: Dict[str, Set[str]] = {}
         self._trace: List[Dict[str, Any]] = []
+        # Cached immutable snapshot of the trace; the trace is append-only,
+        # so the snapshot is stale exactly when its length differs
+        self._trace_snapshot: Optional[Tuple[Dict[str, Any], ...]] = None
 
     def set(
         self,
@@ -58,13 +79,21 @@ class Canvas:
             entry_type: Type of entry (data, artifact, result, etc.)
             metadata: Optional metadata
         """
+        # Interned so the handful of repeated type strings share storage
+        # and bucket lookups compare by identity
+        entry_type = sys.intern(entry_type)
         entry = CanvasEntry(
             key=key,
             value=value,
             entry_type=entry_type,
+            timestamp=self._timestamp(),
             metadata=metadata or {}
         )
+        previous = self._entries.get(key)
+        if previous is not None and previous.entry_type != entry_type:
+            self._by_type[previous.entry_type].discard(key)
         self._entries[key] = entry
+        self._by_type.setdefault(entry_type, set()).add(key)
 
         # Add to trace
         self._trace.append({
@@ -74,6 +103,21 @@ class Canvas:
             "timestamp": entry.timestamp
         })
 
+    def _timestamp(self) -> Union[str, int]:
+        """Current timestamp: ISO string, or raw nanoseconds in fast mode."""
+        if self._fast_timestamps:
+            return time.time_ns()
+        return _utc_now_iso()
+
+    @staticmethod
+    def _format_timestamp(ts: Union[str, int]) -> str:
+        """Render a stored timestamp as ISO-8601 (no-op if already ISO)."""
+        if isinstance(ts, int):
+            return datetime.fromtimestamp(ts / 1e9, _UTC).isoformat(
+                timespec="milliseconds"
+            )
+        return ts
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a value from the canvas.
@@ -107,12 +151,22 @@ class Canvas:
             List of keys
         """
         if entry_type:
-            return [k for k, v in self._entries.items() if v.entry_type == entry_type]
+            return list(self._by_type.get(entry_type, ()))
         return list(self._entries.keys())
 
-    def get_trace(self) -> List[Dict[str, Any]]:
-        """Get execution trace."""
-        return self._trace.copy()
+    def get_trace(self) -> Tuple[Dict[str, Any], ...]:
+        """
+        Get execution trace.
+
+        Returns an immutable snapshot; repeated calls between appends
+        reuse the same tuple instead of re-copying the whole trace.
+        """
+        if (
+            self._trace_snapshot is None
+            or len(self._trace_snapshot) != len(self._trace)
+        ):
+            self._trace_snapshot = tuple(self._trace)
+        return self._trace_snapshot
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -121,6 +175,14 @@ class Canvas:
         Returns:
             Dict with all canvas data
         """
+        if self._fast_timestamps:
+            trace = [
+                {**t, "timestamp": self._format_timestamp(t["timestamp"])}
+                for t in self._trace
+            ]
+        else:
+            trace = self._trace
+
         return {
             "conversation_id": self.conversation_id,
             "created_at": self.created_at,
@@ -128,18 +190,19 @@ class Canvas:
                 k: {
                     "value": v.value,
                     "type": v.entry_type,
-                    "timestamp": v.timestamp,
+                    "timestamp": self._format_timestamp(v.timestamp),
                     "metadata": v.metadata
                 }
                 for k, v in self._entries.items()
             },
-            "trace": self._trace
+            "trace": trace
         }
 
     def clear(self) -> None:
         """Clear all entries (trace is preserved)."""
         self._entries.clear()
+        self._by_type.clear()
         self._trace.append({
             "action": "clear",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": self._timestamp()
         })
@@ -17,9 +17,11 @@ Commands:
     ntrli providers disable <name>  Disable a provider
 """
 
+from __future__ import annotations
+
+import functools
+import os
 import sys
-import json
-import argparse
 from typing import List, Optional
 
 from config import (
@@ -33,6 +35,93 @@ from config import (
     USER_SETTINGS_FILE,
 )
 
+# json and argparse are imported inside the functions that need them:
+# short-lived invocations like `ntrli version` pay for neither.
+
+VERSION_STRING = "NTRLI' AI v1.0.0"
+
+# Hand-written summary for the bare `ntrli` invocation: printing it
+# avoids building any argparse tree just to show help and exit
+_USAGE = """\
+usage: ntrli [-h] [--no-color] [--json] {run,config,providers,version} ...
+
+NTRLI' AI - Deterministic Execution-First AI System
+
+commands:
+  run <instruction>     Execute an instruction
+  config                Configuration commands (show|get|set|reset|init)
+  providers             Provider commands (list|enable|disable|model)
+  version               Show version
+
+options:
+  -h, --help            show this help message and exit
+  --no-color            Disable colored output
+  --json                Output in JSON format
+"""
+
+# Literal scalars recognized before falling back to the JSON parser
+_SCALARS = {
+    "true": True,
+    "True": True,
+    "false": False,
+    "False": False,
+    "null": None,
+}
+
+_ROUTER_STRATEGIES = ("fastest", "cheapest", "smartest", "consensus", "fallback")
+
+
+def _coerce_strategy(raw: str) -> str:
+    if raw not in _ROUTER_STRATEGIES:
+        raise ValueError(
+            f"invalid strategy {raw!r} (choose from {', '.join(_ROUTER_STRATEGIES)})"
+        )
+    return raw
+
+
+def _coerce_bool(raw: str) -> bool:
+    value = _SCALARS.get(raw)
+    if not isinstance(value, bool):
+        raise ValueError(f"expected true or false, got {raw!r}")
+    return value
+
+
+# Known dot-paths coerce (and validate) directly - no JSON round-trip,
+# and a bad value fails before anything is written
+_KEY_COERCERS = {
+    "router.strategy": _coerce_strategy,
+    "router.timeout_seconds": int,
+    "router.max_retries": int,
+    "execution.sandbox_timeout": int,
+    "execution.test_timeout": int,
+    "execution.max_steps": int,
+    "execution.enable_cache": _coerce_bool,
+    "github.enabled": _coerce_bool,
+    "github.auto_commit": _coerce_bool,
+    "ui.verbose": _coerce_bool,
+    "ui.color_output": _coerce_bool,
+    "ui.show_plan": _coerce_bool,
+    "ui.show_progress": _coerce_bool,
+    "ui.json_output": _coerce_bool,
+}
+
+
+def _auto_coerce(raw: str):
+    """Best-effort coercion for keys without a registered coercer."""
+    if raw in _SCALARS:
+        return _SCALARS[raw]
+    if raw.lstrip("-").isdigit():
+        return int(raw)
+    if raw.lstrip("-").replace(".", "", 1).isdigit():
+        return float(raw)
+    if raw.startswith(("{", "[", '"')):
+        import json
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return raw
+    return raw
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -46,6 +135,21 @@ class Colors:
     DIM = '\033[2m'
     RESET = '\033[0m'
 
+    # Combined prefixes assembled once (see _recompute): the print
+    # helpers concatenate two strings instead of 4-5 fragments per call
+    HEADER_PREFIX = ''
+    SUCCESS_PREFIX = ''
+    ERROR_PREFIX = ''
+    INFO_PREFIX = ''
+
+    @classmethod
+    def _recompute(cls):
+        """Rebuild the combined prefixes from the current codes."""
+        cls.HEADER_PREFIX = cls.BOLD + cls.CYAN
+        cls.SUCCESS_PREFIX = cls.GREEN + "✓" + cls.RESET + " "
+        cls.ERROR_PREFIX = cls.RED + "✗" + cls.RESET + " "
+        cls.INFO_PREFIX = cls.BLUE + "ℹ" + cls.RESET + " "
+
     @classmethod
     def disable(cls):
         """Disable colors."""
@@ -58,27 +162,33 @@ class Colors:
         cls.BOLD = ''
         cls.DIM = ''
         cls.RESET = ''
+        cls._recompute()
+
+
+Colors._recompute()
 
 
 def print_header(text: str) -> None:
     """Print a header."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{text}{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * len(text)}{Colors.RESET}")
+    sys.stdout.write(
+        f"\n{Colors.HEADER_PREFIX}{text}{Colors.RESET}\n"
+        f"{Colors.DIM}{'─' * len(text)}{Colors.RESET}\n"
+    )
 
 
 def print_success(text: str) -> None:
     """Print success message."""
-    print(f"{Colors.GREEN}✓{Colors.RESET} {text}")
+    sys.stdout.write(Colors.SUCCESS_PREFIX + text + "\n")
 
 
 def print_error(text: str) -> None:
     """Print error message."""
-    print(f"{Colors.RED}✗{Colors.RESET} {text}", file=sys.stderr)
+    sys.stderr.write(Colors.ERROR_PREFIX + text + "\n")
 
 
 def print_info(text: str) -> None:
     """Print info message."""
-    print(f"{Colors.BLUE}ℹ{Colors.RESET} {text}")
+    sys.stdout.write(Colors.INFO_PREFIX + text + "\n")
 
 
 def print_key_value(key: str, value: str, indent: int = 0) -> None:
@@ -92,27 +202,38 @@ def cmd_config_show(args: argparse.Namespace) -> int:
     config = get_config()
     settings = config.to_dict()
 
-    print_header("NTRLI' AI Configuration")
+    # Buffer the whole report and emit one write: 60+ lines of per-print
+    # syscalls collapse into a single flush
+    buf: List[str] = []
+
+    def kv(key: str, value: str, indent: int = 0) -> None:
+        buf.append(f"{'  ' * indent}{Colors.CYAN}{key}{Colors.RESET}: {value}")
+
+    title = "NTRLI' AI Configuration"
+    buf.append(f"\n{Colors.BOLD}{Colors.CYAN}{title}{Colors.RESET}")
+    buf.append(f"{Colors.DIM}{'─' * len(title)}{Colors.RESET}")
 
     # Show config file locations
-    print_info(f"User config: {USER_SETTINGS_FILE}")
-    print()
+    buf.append(f"{Colors.BLUE}ℹ{Colors.RESET} User config: {USER_SETTINGS_FILE}")
+    buf.append("")
 
     # Show settings by section
     for section, values in settings.items():
-        print(f"{Colors.BOLD}{section}:{Colors.RESET}")
+        buf.append(f"{Colors.BOLD}{section}:{Colors.RESET}")
         if isinstance(values, dict):
             for key, value in values.items():
                 if isinstance(value, dict):
-                    print(f"  {Colors.CYAN}{key}{Colors.RESET}:")
+                    buf.append(f"  {Colors.CYAN}{key}{Colors.RESET}:")
                     for k, v in value.items():
-                        print_key_value(k, str(v), indent=2)
+                        kv(k, str(v), indent=2)
                 else:
-                    print_key_value(key, str(value), indent=1)
+                    kv(key, str(value), indent=1)
         else:
-            print(f"  {values}")
-        print()
+            buf.append(f"  {values}")
+        buf.append("")
 
+    sys.stdout.write("\n".join(buf) + "\n")
+    sys.stdout.flush()
     return 0
 
 
@@ -124,6 +245,7 @@ def cmd_config_get(args: argparse.Namespace) -> int:
         return 1
 
     if isinstance(value, (dict, list)):
+        import json
         print(json.dumps(value, indent=2))
     else:
         print(value)
@@ -132,20 +254,12 @@ def cmd_config_get(args: argparse.Namespace) -> int:
 
 def cmd_config_set(args: argparse.Namespace) -> int:
     """Set a configuration value."""
-    # Try to parse value as JSON for complex types
+    coerce = _KEY_COERCERS.get(args.key, _auto_coerce)
     try:
-        value = json.loads(args.value)
-    except json.JSONDecodeError:
-        # Use as string
-        value = args.value
-
-        # Convert common string values
-        if value.lower() == "true":
-            value = True
-        elif value.lower() == "false":
-            value = False
-        elif value.isdigit():
-            value = int(value)
+        value = coerce(args.value)
+    except ValueError as e:
+        print_error(f"Invalid value for {args.key}: {e}")
+        return 1
 
     config_set(args.key, value)
     print_success(f"Set {args.key} = {value}")
@@ -170,7 +284,12 @@ def cmd_providers_list(args: argparse.Namespace) -> int:
     """List available providers."""
     config = get_config()
 
-    print_header("LLM Providers")
+    # Buffered like cmd_config_show: one write for the whole listing
+    buf: List[str] = []
+
+    title = "LLM Providers"
+    buf.append(f"\n{Colors.BOLD}{Colors.CYAN}{title}{Colors.RESET}")
+    buf.append(f"{Colors.DIM}{'─' * len(title)}{Colors.RESET}")
 
     providers = config.settings.providers
     enabled = config.get_enabled_providers()
@@ -179,15 +298,17 @@ def cmd_providers_list(args: argparse.Namespace) -> int:
         cfg = providers[name]
         model = cfg.get("model", "default")
         priority = cfg.get("priority", 99)
-        print(f"  {Colors.GREEN}●{Colors.RESET} {Colors.BOLD}{name}{Colors.RESET}")
-        print(f"    model: {model}")
-        print(f"    priority: {priority}")
-        print()
+        buf.append(f"  {Colors.GREEN}●{Colors.RESET} {Colors.BOLD}{name}{Colors.RESET}")
+        buf.append(f"    model: {model}")
+        buf.append(f"    priority: {priority}")
+        buf.append("")
 
     disabled = [n for n in providers if n not in enabled]
     if disabled:
-        print(f"{Colors.DIM}Disabled: {', '.join(disabled)}{Colors.RESET}")
+        buf.append(f"{Colors.DIM}Disabled: {', '.join(disabled)}{Colors.RESET}")
 
+    sys.stdout.write("\n".join(buf) + "\n")
+    sys.stdout.flush()
     return 0
 
 
@@ -230,36 +351,19 @@ def cmd_run(args: argparse.Namespace) -> int:
 
 def cmd_version(args: argparse.Namespace) -> int:
     """Show version."""
-    print("NTRLI' AI v1.0.0")
+    print(VERSION_STRING)
     return 0
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser."""
-    parser = argparse.ArgumentParser(
-        prog="ntrli",
-        description="NTRLI' AI - Deterministic Execution-First AI System",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    parser.add_argument(
-        "--no-color",
-        action="store_true",
-        help="Disable colored output"
-    )
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Output in JSON format"
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-
-    # run command
+def _add_run_parser(subparsers) -> None:
+    """Build the `run` subcommand."""
     run_parser = subparsers.add_parser("run", help="Execute an instruction")
     run_parser.add_argument("instruction", help="The instruction to execute")
     run_parser.set_defaults(func=cmd_run)
 
-    # config command
+
+def _add_config_parser(subparsers) -> None:
+    """Build the `config` subcommand tree."""
     config_parser = subparsers.add_parser("config", help="Configuration commands")
     config_subparsers = config_parser.add_subparsers(dest="config_command")
 
@@ -288,7 +392,9 @@ def create_parser() -> argparse.ArgumentParser:
 
     config_parser.set_defaults(func=cmd_config_show)
 
-    # providers command
+
+def _add_providers_parser(subparsers) -> None:
+    """Build the `providers` subcommand tree."""
     providers_parser = subparsers.add_parser("providers", help="Provider commands")
     providers_subparsers = providers_parser.add_subparsers(dest="providers_command")
 
@@ -314,16 +420,95 @@ def create_parser() -> argparse.ArgumentParser:
 
     providers_parser.set_defaults(func=cmd_providers_list)
 
-    # version command
+
+def _add_version_parser(subparsers) -> None:
+    """Build the `version` subcommand."""
     version_parser = subparsers.add_parser("version", help="Show version")
     version_parser.set_defaults(func=cmd_version)
 
+
+# Subcommand builders, invoked lazily: a normal invocation names exactly
+# one command, so only that branch of the parser tree needs to exist
+_SUBPARSER_BUILDERS = {
+    "run": _add_run_parser,
+    "config": _add_config_parser,
+    "providers": _add_providers_parser,
+    "version": _add_version_parser,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def create_parser(only: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Create argument parser (cached per command branch).
+
+    Args:
+        only: A known command name to build just that subcommand's
+            branch. Any other value (including None) builds the full
+            tree, which --help and error reporting need.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="ntrli",
+        description="NTRLI' AI - Deterministic Execution-First AI System",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--no-color",
+        action="store_true",
+        help="Disable colored output"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    if only in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[only](subparsers)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers)
+
     return parser
 
 
 def main(argv: Optional[List[str]] = None) -> int:
     """Main CLI entry point."""
-    parser = create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # When piped, make sure stdout is fully block-buffered (it can be
+    # line-buffered or unbuffered via PYTHONUNBUFFERED/embedding), so
+    # output costs one write per buffer instead of one per line
+    # Nobody renders ANSI codes in a pipe; honor NO_COLOR either way
+    if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+        Colors.disable()
+
+    if not sys.stdout.isatty():
+        import atexit
+        try:
+            sys.stdout.reconfigure(line_buffering=False, write_through=False)
+        except (AttributeError, OSError):
+            pass
+        atexit.register(sys.stdout.flush)
+
+    # Fast paths: `ntrli version` and bare `ntrli` do no real work, so
+    # neither builds a parser
+    if argv == ["version"]:
+        print(VERSION_STRING)
+        return 0
+    if not argv:
+        sys.stdout.write(_USAGE)
+        return 0
+
+    # Peek at the command word so create_parser can skip the subparsers
+    # that this invocation can never reach
+    command = next((a for a in argv if not a.startswith("-")), None)
+    parser = create_parser(only=command)
     args = parser.parse_args(argv)
 
     # Handle color settings
@@ -14,18 +14,41 @@ Supports:
 Similar to Claude Code's configuration style.
 """
 
+import functools
 import os
 import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field, asdict
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 
 # Default paths
 USER_CONFIG_DIR = Path.home() / ".ntrli_ai"
 USER_SETTINGS_FILE = USER_CONFIG_DIR / "settings.json"
 LOCAL_SETTINGS_FILE = Path(".ntrli_ai.json")
 
+# Sentinel distinguishing "absent" from a stored None
+_MISSING = object()
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
 
 @dataclass
 class ProviderConfig:
@@ -74,22 +97,48 @@ class UIConfig:
     json_output: bool = False
 
 
+# Default provider rows share one key layout: dicts built from the same
+# zip(_PROVIDER_KEYS, ...) sequence reuse the interned key strings, and
+# the compact tuple table reads/diffs better than ten dict literals
+_PROVIDER_KEYS = ("enabled", "model", "priority")
+_PROVIDER_DEFAULTS = (
+    ("openai", True, "gpt-4o", 2),
+    ("claude", True, "claude-sonnet-4-20250514", 1),
+    ("gemini", True, "gemini-2.5-flash", 3),
+    ("groq", True, "llama-3.3-70b-versatile", 0),
+    ("mistral", True, "mistral-large-latest", 4),
+    ("together", True, "meta-llama/Llama-3.3-70B-Instruct", 5),
+    ("deepseek", True, "deepseek-chat", 6),
+    ("replicate", False, "meta/meta-llama-3.3-70b-instruct", 7),
+    ("huggingface", False, "meta-llama/Llama-3.3-70B-Instruct", 8),
+    ("cohere", False, "command-r-plus", 9),
+)
+
+
+# Environment overrides: env var -> (section, key, converter). Flag-style
+# variables ignore the raw value and pin their setting
+_ENV_MAP = {
+    "ROUTER_STRATEGY": ("router", "strategy", str),
+    "NTRLI_VERBOSE": ("ui", "verbose", lambda _v: True),
+    "NTRLI_JSON_OUTPUT": ("ui", "json_output", lambda _v: True),
+    "NO_COLOR": ("ui", "color_output", lambda _v: False),
+    "NTRLI_SANDBOX_TIMEOUT": ("execution", "sandbox_timeout", int),
+}
+
+
+def _default_providers() -> Dict[str, Dict[str, Any]]:
+    """Build the default provider mapping from the row table."""
+    return {
+        name: dict(zip(_PROVIDER_KEYS, row))
+        for name, *row in _PROVIDER_DEFAULTS
+    }
+
+
 @dataclass
 class Settings:
     """Complete NTRLI' AI settings."""
     # Provider configurations
-    providers: Dict[str, Dict[str, Any]] = field(default_factory=lambda: {
-        "openai": {"enabled": True, "model": "gpt-4o", "priority": 2},
-        "claude": {"enabled": True, "model": "claude-sonnet-4-20250514", "priority": 1},
-        "gemini": {"enabled": True, "model": "gemini-2.5-flash", "priority": 3},
-        "groq": {"enabled": True, "model": "llama-3.3-70b-versatile", "priority": 0},
-        "mistral": {"enabled": True, "model": "mistral-large-latest", "priority": 4},
-        "together": {"enabled": True, "model": "meta-llama/Llama-3.3-70B-Instruct", "priority": 5},
-        "deepseek": {"enabled": True, "model": "deepseek-chat", "priority": 6},
-        "replicate": {"enabled": False, "model": "meta/meta-llama-3.3-70b-instruct", "priority": 7},
-        "huggingface": {"enabled": False, "model": "meta-llama/Llama-3.3-70B-Instruct", "priority": 8},
-        "cohere": {"enabled": False, "model": "command-r-plus", "priority": 9},
-    })
+    providers: Dict[str, Dict[str, Any]] = field(default_factory=_default_providers)
 
     # Router settings
     router: Dict[str, Any] = field(default_factory=lambda: {
@@ -125,6 +174,21 @@ class Settings:
         "json_output": False,
     })
 
+    def to_json_obj(self) -> Dict[str, Any]:
+        """
+        Shallow dict view for serialization.
+
+        The sections are already plain dicts, so the serializer can walk
+        them in place - no asdict() deep copy per save.
+        """
+        return {
+            "providers": self.providers,
+            "router": self.router,
+            "execution": self.execution,
+            "github": self.github,
+            "ui": self.ui,
+        }
+
 
 class ConfigManager:
     """
@@ -140,10 +204,14 @@ class ConfigManager:
     def __init__(self):
         self._settings: Optional[Settings] = None
         self._loaded = False
+        # Memoized asdict() form; every mutation path drops it
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        # Memoized priority-sorted enabled-provider names
+        self._enabled_cache: Optional[List[str]] = None
 
     @property
     def settings(self) -> Settings:
-        """Get current settings, loading if necessary."""
+        """Get current settings, loading from disk if necessary."""
         if not self._loaded:
             self.load()
         return self._settings
@@ -152,14 +220,14 @@ class ConfigManager:
         """Load settings from all sources."""
         # Start with defaults
         self._settings = Settings()
+        self._dict_cache = None
+        self._enabled_cache = None
 
-        # Load user config
-        if USER_SETTINGS_FILE.exists():
-            self._merge_from_file(USER_SETTINGS_FILE)
-
-        # Load local config (overrides user)
-        if LOCAL_SETTINGS_FILE.exists():
-            self._merge_from_file(LOCAL_SETTINGS_FILE)
+        # Load user config, then local config (overrides user). Missing
+        # files are the normal case and handled by _merge_from_file -
+        # no separate exists() stat per file
+        self._merge_from_file(USER_SETTINGS_FILE)
+        self._merge_from_file(LOCAL_SETTINGS_FILE)
 
         # Apply environment overrides
         self._apply_env_overrides()
@@ -168,15 +236,20 @@ class ConfigManager:
         return self._settings
 
     def _merge_from_file(self, path: Path) -> None:
-        """Merge settings from a JSON file."""
+        """Merge settings from a JSON file, if it exists."""
         try:
-            data = json.loads(path.read_text())
-            self._merge_dict(data)
-        except (json.JSONDecodeError, IOError) as e:
+            data = _loads_json(path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (ValueError, OSError) as e:
             print(f"Warning: Failed to load config from {path}: {e}")
+            return
+        self._merge_dict(data)
 
     def _merge_dict(self, data: Dict[str, Any]) -> None:
         """Merge a dictionary into current settings."""
+        self._dict_cache = None
+        self._enabled_cache = None
         if "providers" in data:
             for name, config in data["providers"].items():
                 if name in self._settings.providers:
@@ -197,35 +270,20 @@ class ConfigManager:
             self._settings.ui.update(data["ui"])
 
     def _apply_env_overrides(self) -> None:
-        """Apply environment variable overrides."""
-        # Router strategy
-        if strategy := os.getenv("ROUTER_STRATEGY"):
-            self._settings.router["strategy"] = strategy
-
-        # UI settings
-        if os.getenv("NTRLI_VERBOSE"):
-            self._settings.ui["verbose"] = True
-        if os.getenv("NTRLI_JSON_OUTPUT"):
-            self._settings.ui["json_output"] = True
-        if os.getenv("NO_COLOR"):
-            self._settings.ui["color_output"] = False
-
-        # Execution settings
-        if timeout := os.getenv("NTRLI_SANDBOX_TIMEOUT"):
-            self._settings.execution["sandbox_timeout"] = int(timeout)
+        """Apply environment variable overrides (table-driven)."""
+        environ = os.environ
+        for env_var, (section, key, convert) in _ENV_MAP.items():
+            if value := environ.get(env_var):
+                getattr(self._settings, section)[key] = convert(value)
 
     def save_user_settings(self) -> None:
         """Save current settings to user config file."""
         USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        USER_SETTINGS_FILE.write_text(
-            json.dumps(asdict(self._settings), indent=2)
-        )
+        USER_SETTINGS_FILE.write_bytes(_dumps_json(self.settings.to_json_obj()))
 
     def save_local_settings(self) -> None:
         """Save current settings to local project file."""
-        LOCAL_SETTINGS_FILE.write_text(
-            json.dumps(asdict(self._settings), indent=2)
-        )
+        LOCAL_SETTINGS_FILE.write_bytes(_dumps_json(self.settings.to_json_obj()))
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -234,9 +292,14 @@ class ConfigManager:
         Example: config.get("router.strategy")
         """
         parts = key.split(".")
-        value = asdict(self.settings)
 
-        for part in parts:
+        # Walk the dataclass attribute then plain dicts directly; the old
+        # asdict() round-trip deep-copied every section per lookup
+        value = getattr(self.settings, parts[0], _MISSING)
+        if value is _MISSING:
+            return default
+
+        for part in parts[1:]:
             if isinstance(value, dict) and part in value:
                 value = value[part]
             else:
@@ -251,66 +314,79 @@ class ConfigManager:
         Example: config.set("router.strategy", "fastest")
         """
         parts = key.split(".")
+        # Go through the loading property: mutating a not-yet-loaded
+        # _settings would be silently discarded by the next load()
+        settings = self.settings
+        self._dict_cache = None
+        self._enabled_cache = None
 
         if len(parts) == 1:
-            setattr(self._settings, key, value)
+            setattr(settings, key, value)
         elif len(parts) == 2:
             section, setting = parts
-            if hasattr(self._settings, section):
-                getattr(self._settings, section)[setting] = value
+            if hasattr(settings, section):
+                getattr(settings, section)[setting] = value
 
     def reset(self) -> None:
-        """Reset to default settings."""
+        """Reset to default settings (no disk read)."""
         self._settings = Settings()
         self._loaded = True
+        self._dict_cache = None
+        self._enabled_cache = None
 
     def list_providers(self) -> List[str]:
         """List all configured providers."""
         return list(self.settings.providers.keys())
 
     def get_enabled_providers(self) -> List[str]:
-        """List enabled providers sorted by priority."""
-        enabled = [
-            (name, config.get("priority", 99))
-            for name, config in self.settings.providers.items()
-            if config.get("enabled", True)
-        ]
-        return [name for name, _ in sorted(enabled, key=lambda x: x[1])]
+        """List enabled providers sorted by priority (memoized)."""
+        if self._enabled_cache is None:
+            enabled = [
+                (name, config.get("priority", 99))
+                for name, config in self.settings.providers.items()
+                if config.get("enabled", True)
+            ]
+            self._enabled_cache = [
+                name for name, _ in sorted(enabled, key=lambda x: x[1])
+            ]
+        return self._enabled_cache
 
     def enable_provider(self, name: str) -> None:
         """Enable a provider."""
         if name in self.settings.providers:
             self.settings.providers[name]["enabled"] = True
+            self._dict_cache = None
+            self._enabled_cache = None
 
     def disable_provider(self, name: str) -> None:
         """Disable a provider."""
         if name in self.settings.providers:
             self.settings.providers[name]["enabled"] = False
+            self._dict_cache = None
+            self._enabled_cache = None
 
     def set_provider_model(self, name: str, model: str) -> None:
         """Set model for a provider."""
         if name in self.settings.providers:
             self.settings.providers[name]["model"] = model
+            self._dict_cache = None
+            self._enabled_cache = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Export settings as dictionary."""
-        return asdict(self.settings)
+        """Export settings as dictionary (memoized until a mutation)."""
+        if self._dict_cache is None:
+            self._dict_cache = asdict(self.settings)
+        return self._dict_cache
 
     def to_json(self, indent: int = 2) -> str:
         """Export settings as JSON string."""
         return json.dumps(self.to_dict(), indent=indent)
 
 
-# Global config instance
-_config: Optional[ConfigManager] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_config() -> ConfigManager:
     """Get the global configuration manager."""
-    global _config
-    if _config is None:
-        _config = ConfigManager()
-    return _config
+    return ConfigManager()
 
 
 def init_config() -> None:
@@ -318,11 +394,14 @@ def init_config() -> None:
     config = get_config()
     config.load()
 
-    # Create user config dir if it doesn't exist
-    if not USER_CONFIG_DIR.exists():
-        USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        config.save_user_settings()
-        print(f"Created config directory: {USER_CONFIG_DIR}")
+    # Create user config dir if it doesn't exist - a single mkdir call
+    # instead of a check-then-create stat pair
+    try:
+        USER_CONFIG_DIR.mkdir(parents=True)
+    except FileExistsError:
+        return
+    config.save_user_settings()
+    print(f"Created config directory: {USER_CONFIG_DIR}")
 
 
 # CLI-style configuration functions
@@ -348,3 +427,5 @@ def config_reset() -> None:
     config = get_config()
     config.reset()
     config.save_user_settings()
+    # Drop the singleton too, so the next get_config() starts clean
+    get_config.cache_clear()
@@ -12,9 +12,10 @@ This gate ensures:
 3. No unauthorized operations
 """
 
-from typing import Dict, Any
-from orchestrator import Orchestrator
-from providers.router import Router
+from typing import Any, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from providers.router import Router
 
 
 class CommandError(RuntimeError):
@@ -31,13 +32,18 @@ class ControlPlane:
 
     ALLOWED_COMMAND = "EXECUTE"
 
-    def __init__(self, router: Router):
+    def __init__(self, router: "Router"):
         """
         Initialize control plane with LLM router.
 
         Args:
             router: The LLM router for the orchestrator
         """
+        # Imported here, not at module top: pulling in the orchestrator
+        # drags the full planner/provider stack, which fast CLI paths
+        # (version, config) never need
+        from orchestrator import Orchestrator
+
         self.orchestrator = Orchestrator(router)
 
     def handle(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -12,8 +12,8 @@ If an operation fails:
 3. Never swallow exceptions silently
 """
 
-from typing import Callable, TypeVar, Optional
-import time
+from typing import Callable, TypeVar
+import threading
 
 T = TypeVar('T')
 
@@ -23,6 +23,13 @@ class RecoveryError(RuntimeError):
     pass
 
 
+def _format_errors(errors: list[tuple[int, BaseException]]) -> str:
+    """Render collected (attempt, exception) pairs for the final error."""
+    return "\n".join(
+        f"Attempt {a}: {type(e).__name__}: {e}" for a, e in errors
+    )
+
+
 class FailureRecovery:
     """
     Failure recovery with bounded retry logic.
@@ -33,6 +40,24 @@ class FailureRecovery:
     MAX_RETRIES = 2
     RETRY_DELAY_SECONDS = 1.0
 
+    # Exponential backoff factors (1, 2, 4, ...) precomputed; beyond the
+    # table the delay is pinned at max_delay anyway
+    _BACKOFF_FACTORS = tuple(float(1 << i) for i in range(8))
+
+    def __init__(self):
+        # Waited on instead of time.sleep so pending retries can be
+        # cancelled from another thread without blocking for the full
+        # delay
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        """Cancel any in-progress retry waits."""
+        self._stop_event.set()
+
+    def _wait(self, delay: float) -> bool:
+        """Interruptible sleep. Returns True if a stop was requested."""
+        return self._stop_event.wait(delay)
+
     def should_retry(self, attempt: int) -> bool:
         """
         Determine if another retry should be attempted.
@@ -64,28 +89,29 @@ class FailureRecovery:
             RecoveryError: If all retries fail
         """
         attempt = 0
-        last_error: Optional[Exception] = None
-        errors: list[str] = []
+        # Exceptions are kept raw and only formatted if every attempt
+        # fails - the success path never pays for message building
+        errors: list[tuple[int, BaseException]] = []
 
         while True:
             attempt += 1
             try:
                 return func()
             except Exception as e:
-                last_error = e
-                errors.append(f"Attempt {attempt}: {type(e).__name__}: {e}")
+                errors.append((attempt, e))
 
                 if not self.should_retry(attempt):
                     break
 
-                # Wait before retry
-                time.sleep(self.RETRY_DELAY_SECONDS)
+                # Wait before retry (abandons remaining attempts on stop)
+                if self._wait(self.RETRY_DELAY_SECONDS):
+                    break
 
         # All retries exhausted
-        error_log = "\n".join(errors)
         raise RecoveryError(
-            f"Failed {description} after {attempt} attempts:\n{error_log}"
-        ) from last_error
+            f"Failed {description} after {attempt} attempts:\n"
+            + _format_errors(errors)
+        ) from errors[-1][1]
 
     def retry_with_backoff(
         self,
@@ -110,25 +136,28 @@ class FailureRecovery:
             RecoveryError: If all retries fail
         """
         attempt = 0
-        last_error: Optional[Exception] = None
-        errors: list[str] = []
+        errors: list[tuple[int, BaseException]] = []
 
         while True:
             attempt += 1
             try:
                 return func()
             except Exception as e:
-                last_error = e
-                errors.append(f"Attempt {attempt}: {type(e).__name__}: {e}")
+                errors.append((attempt, e))
 
                 if not self.should_retry(attempt):
                     break
 
                 # Exponential backoff with cap
-                delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
-                time.sleep(delay)
+                idx = attempt - 1
+                if idx < len(self._BACKOFF_FACTORS):
+                    delay = min(base_delay * self._BACKOFF_FACTORS[idx], max_delay)
+                else:
+                    delay = max_delay
+                if self._wait(delay):
+                    break
 
-        error_log = "\n".join(errors)
         raise RecoveryError(
-            f"Failed {description} after {attempt} attempts:\n{error_log}"
-        ) from last_error
+            f"Failed {description} after {attempt} attempts:\n"
+            + _format_errors(errors)
+        ) from errors[-1][1]
@@ -6,5 +6,6 @@ GitHub integration module for repository operations.
 """
 
 from .write_client import GitHubWriteClient
+from .async_client import AsyncGitHubWriteClient
 
-__all__ = ["GitHubWriteClient"]
+__all__ = ["GitHubWriteClient", "AsyncGitHubWriteClient"]
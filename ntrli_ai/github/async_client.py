@@ -0,0 +1,202 @@
+# ============================================================================
+# NTRLI' AI - ASYNC GITHUB WRITE CLIENT
+# ============================================================================
+"""
+Asyncio variant of the GitHub write client.
+
+Mirrors the core of GitHubWriteClient on top of httpx so many file
+operations overlap on one event loop instead of blocking one at a
+time. httpx is an optional dependency; the synchronous client keeps
+working without it.
+"""
+
+import asyncio
+import os
+from typing import Dict, List, Optional, Any
+
+from .write_client import _UNKNOWN, _b64_content
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class AsyncGitHubWriteClient:
+    """
+    Async GitHub API client for write operations.
+
+    Requests are multiplexed over a shared HTTP/2 connection pool and
+    write fan-out is bounded by a semaphore, matching the sync client's
+    concurrency cap.
+    """
+
+    MAX_WRITE_WORKERS = 8
+
+    def __init__(self, token: Optional[str] = None):
+        """
+        Initialize async GitHub client.
+
+        Args:
+            token: GitHub API token (defaults to GITHUB_TOKEN env var)
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncGitHubWriteClient requires httpx (pip install httpx)"
+            )
+
+        self.token = token or os.getenv("GITHUB_TOKEN")
+        if not self.token:
+            raise ValueError("GitHub token required (set GITHUB_TOKEN or pass token)")
+
+        self.base_url = "https://api.github.com"
+        self.client = httpx.AsyncClient(
+            http2=True,
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/vnd.github.v3+json"
+            },
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
+        self._write_slots = asyncio.Semaphore(self.MAX_WRITE_WORKERS)
+
+    async def close(self) -> None:
+        """Release the client's pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncGitHubWriteClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def get_file(
+        self,
+        repo: str,
+        path: str,
+        branch: str = "main"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get file content and metadata.
+
+        Args:
+            repo: Repository in 'owner/repo' format
+            path: File path in repository
+            branch: Branch name
+
+        Returns:
+            File metadata including sha and content, or None if not found
+        """
+        url = f"{self.base_url}/repos/{repo}/contents/{path}"
+        response = await self.client.get(url, params={"ref": branch})
+        if response.status_code == 200:
+            return response.json()
+        return None
+
+    async def create_or_update_file(
+        self,
+        repo: str,
+        path: str,
+        content: str,
+        message: str,
+        branch: str = "main",
+        known_sha: Any = _UNKNOWN
+    ) -> Dict[str, Any]:
+        """
+        Create or update a file in the repository.
+
+        Args:
+            repo: Repository in 'owner/repo' format
+            path: File path in repository
+            content: File content
+            message: Commit message
+            branch: Branch name
+            known_sha: Blob SHA the caller already knows (None if the
+                file is known not to exist); skips the get_file probe
+
+        Returns:
+            API response with commit details
+        """
+        url = f"{self.base_url}/repos/{repo}/contents/{path}"
+
+        if known_sha is _UNKNOWN:
+            existing = await self.get_file(repo, path, branch)
+            sha = existing.get("sha") if existing else None
+        else:
+            sha = known_sha
+
+        data = {
+            "message": message,
+            "content": _b64_content(content),
+            "branch": branch
+        }
+        if sha:
+            data["sha"] = sha
+
+        response = await self.client.put(url, json=data)
+        response.raise_for_status()
+        return response.json()
+
+    async def write_files(
+        self,
+        repo: str,
+        files: Dict[str, str],
+        message: str,
+        branch: str = "main"
+    ) -> List[Dict[str, Any]]:
+        """
+        Write multiple files concurrently.
+
+        Args:
+            repo: Repository in 'owner/repo' format
+            files: Dict mapping paths to content
+            message: Commit message prefix
+            branch: Branch name
+
+        Returns:
+            List of API responses for each file, in input order
+        """
+        tree = await self._prefetch_tree(repo, branch)
+
+        async def _write_one(path: str, content: str) -> Dict[str, Any]:
+            async with self._write_slots:
+                return await self.create_or_update_file(
+                    repo=repo,
+                    path=path,
+                    content=content,
+                    message=f"{message}: {path}",
+                    branch=branch,
+                    known_sha=tree.get(path) if tree is not None else _UNKNOWN
+                )
+
+        return list(await asyncio.gather(*[
+            _write_one(path, content) for path, content in files.items()
+        ]))
+
+    async def _prefetch_tree(
+        self, repo: str, branch: str
+    ) -> Optional[Dict[str, str]]:
+        """
+        Fetch the branch tree once and map path -> blob SHA.
+
+        Mirrors the sync client: empty repositories and unborn branches
+        (404/409) yield an empty map, and a truncated listing yields
+        None so write_files probes per file instead of issuing sha-less
+        updates.
+        """
+        url = f"{self.base_url}/repos/{repo}/git/trees/{branch}"
+        response = await self.client.get(url, params={"recursive": "1"})
+        if response.status_code in (404, 409):
+            return {}
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("truncated"):
+            return None
+        return {
+            item["path"]: item["sha"]
+            for item in payload.get("tree", [])
+            if item.get("type") == "blob"
+        }
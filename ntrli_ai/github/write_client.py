@@ -9,8 +9,36 @@ BEHAVIORAL LAW: No writing to GitHub without tests passing.
 
 import os
 import base64
-from typing import Dict, List, Optional, Any
+import itertools
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Distinguishes "caller didn't say" from "caller knows the file is new"
+# (known_sha=None) in create_or_update_file
+_UNKNOWN = object()
+
+
+def _b64_content(content: Union[str, bytes]) -> str:
+    """
+    Base64-encode file content for the API with minimal copying.
+
+    Callers holding bytes (binary files, pre-encoded payloads) skip the
+    str -> utf-8 round trip entirely; str content is encoded once.
+    """
+    data = content if isinstance(content, bytes) else content.encode("utf-8", "surrogatepass")
+    return base64.b64encode(data).decode("ascii")
 
 
 class GitHubWriteClient:
@@ -20,23 +48,201 @@ class GitHubWriteClient:
     Provides methods for creating/updating files, branches, and pull requests.
     """
 
-    def __init__(self, token: Optional[str] = None):
+    # Upper bound on concurrent write requests, shared across all client
+    # instances - GitHub advises keeping per-user write concurrency low
+    MAX_WRITE_WORKERS = 8
+    _write_slots = threading.Semaphore(MAX_WRITE_WORKERS)
+
+    # Bound on cached (repo, path, branch) -> (etag, body) entries
+    ETAG_CACHE_SIZE = 1024
+
+    # Backoff parameters for rate-limit/5xx retries in _request
+    BACKOFF_BASE = 1.0
+    BACKOFF_CAP = 60.0
+    MAX_ATTEMPTS = 6
+
+    def __init__(self, token: Optional[Union[str, List[str]]] = None):
         """
         Initialize GitHub client.
 
         Args:
-            token: GitHub API token (defaults to GITHUB_TOKEN env var)
+            token: GitHub API token, or a list of tokens to round-robin
+                across (defaults to GITHUB_TOKENS / GITHUB_TOKEN env
+                vars). Each token carries its own 5000 req/hr budget,
+                so a pool scales the rate limit linearly - per-token
+                concurrency limits still apply.
         """
-        self.token = token or os.getenv("GITHUB_TOKEN")
-        if not self.token:
+        tokens = self._resolve_tokens(token)
+        if not tokens:
             raise ValueError("GitHub token required (set GITHUB_TOKEN or pass token)")
 
+        self.token = tokens[0]
+        self._tokens = itertools.cycle(tokens)
+        self._token_count = len(tokens)
+        # token -> unix time when it becomes usable again after a
+        # rate-limit response
+        self._token_deadlines: Dict[str, float] = {}
+        self._token_lock = threading.Lock()
+
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/vnd.github.v3+json"
         }
         self.base_url = "https://api.github.com"
 
+        # ETag memory for get_file: a 304 on If-None-Match is a tiny
+        # response and does not count against the primary rate limit
+        self._etag_cache: "OrderedDict[Tuple[str, str, str], Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
+
+        # A single session keeps the connection pool (and its TLS
+        # sessions) warm across calls - write_files would otherwise pay
+        # a full handshake per file
+        self.session = self._build_transport()
+
+    @staticmethod
+    def _resolve_tokens(token: Optional[Union[str, List[str]]]) -> List[str]:
+        """Normalize the token argument/env vars into a token list."""
+        if isinstance(token, str):
+            return [token]
+        if token:
+            return list(token)
+        pool = os.getenv("GITHUB_TOKENS")
+        if pool:
+            return [t.strip() for t in pool.split(",") if t.strip()]
+        single = os.getenv("GITHUB_TOKEN")
+        return [single] if single else []
+
+    def _next_token(self) -> tuple:
+        """
+        Pick the next usable token from the pool.
+
+        Returns:
+            (token, wait_seconds) - wait_seconds is nonzero only when
+            every token is cooling down from a rate limit
+        """
+        with self._token_lock:
+            now = time.time()
+            token = self.token
+            for _ in range(self._token_count):
+                token = next(self._tokens)
+                if self._token_deadlines.get(token, 0.0) <= now:
+                    return token, 0.0
+            wait = min(self._token_deadlines[t] for t in self._token_deadlines) - now
+            return token, max(wait, 0.0)
+
+    def _mark_rate_limited(self, token: str, delay: float) -> None:
+        """Record when a rate-limited token becomes usable again."""
+        with self._token_lock:
+            self._token_deadlines[token] = time.time() + delay
+
+    def _build_transport(self) -> Any:
+        """
+        Build the HTTP transport, preferring HTTP/2 when available.
+
+        With httpx (plus its h2 extra) installed, concurrent write_files
+        PUTs multiplex as streams on one connection instead of competing
+        for pool slots. Otherwise a pooled requests.Session with
+        transport-level retries is used; _request provides the backoff
+        either way.
+        """
+        if httpx is not None:
+            try:
+                return httpx.Client(
+                    http2=True,
+                    headers=self.headers,
+                    limits=httpx.Limits(
+                        max_connections=32,
+                        max_keepalive_connections=16
+                    )
+                )
+            except ImportError:
+                # httpx present but the h2 extra is not
+                pass
+
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        ))
+        return session
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request, backing off on rate limits and server errors.
+
+        The session's urllib3 Retry is the first line of defense, but it
+        cannot see GitHub's 403-with-X-RateLimit-Remaining:0 responses.
+        This helper honors Retry-After/X-RateLimit-Reset on 429 and
+        rate-limited 403s, and applies capped exponential backoff with
+        jitter on 5xx, before giving up and returning the last response.
+
+        Args:
+            method: HTTP method name
+            url: Request URL
+            **kwargs: Passed through to the session
+
+        Returns:
+            The final response (status handling stays with the caller)
+        """
+        response = None
+        for attempt in range(self.MAX_ATTEMPTS):
+            if self._token_count > 1:
+                # Rotate through the pool, skipping tokens still cooling
+                # down; only sleep when every token is rate-limited
+                token, wait = self._next_token()
+                if wait:
+                    time.sleep(min(wait, self.BACKOFF_CAP))
+                headers = dict(kwargs.pop("headers", None) or {})
+                headers["Authorization"] = f"Bearer {token}"
+                kwargs["headers"] = headers
+            else:
+                token = self.token
+
+            response = self.session.request(method, url, **kwargs)
+            status = response.status_code
+
+            rate_limited = status == 429 or (
+                status == 403
+                and response.headers.get("X-RateLimit-Remaining") == "0"
+            )
+            if rate_limited:
+                reset = response.headers.get("X-RateLimit-Reset")
+                delay = max(
+                    float(response.headers.get("Retry-After", 0)),
+                    (int(reset) - time.time()) if reset else 0.0,
+                    1.0
+                )
+                self._mark_rate_limited(token, delay)
+                if self._token_count == 1:
+                    time.sleep(min(delay, self.BACKOFF_CAP))
+                continue
+
+            if status >= 500:
+                delay = min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** attempt)
+                time.sleep(delay + random.uniform(0, 1))
+                continue
+
+            return response
+        return response
+
+    def close(self) -> None:
+        """Release the session's pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "GitHubWriteClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def get_file(
         self,
         repo: str,
@@ -55,23 +261,72 @@ class GitHubWriteClient:
             File metadata including sha and content, or None if not found
         """
         url = f"{self.base_url}/repos/{repo}/contents/{path}"
-        response = requests.get(
-            url,
-            headers=self.headers,
-            params={"ref": branch}
-        )
+        cache_key = (repo, path, branch)
 
+        with self._etag_lock:
+            cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = self._request("get", url, params={"ref": branch}, headers=headers)
+
+        if response.status_code == 304:
+            return cached[1]
         if response.status_code == 200:
-            return response.json()
+            data = response.json()
+            etag = response.headers.get("ETag")
+            if etag:
+                with self._etag_lock:
+                    self._etag_cache[cache_key] = (etag, data)
+                    self._etag_cache.move_to_end(cache_key)
+                    while len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                        self._etag_cache.popitem(last=False)
+            return data
         return None
 
+    def _prefetch_tree(self, repo: str, branch: str) -> Optional[Dict[str, str]]:
+        """
+        Fetch the full branch tree once and map path -> blob SHA.
+
+        One recursive tree request replaces the per-file get_file probe
+        that create_or_update_file would otherwise issue.
+
+        Args:
+            repo: Repository in 'owner/repo' format
+            branch: Branch name
+
+        Returns:
+            Dict mapping file paths to their blob SHAs; empty for an
+            empty repository or unborn branch, or None when the listing
+            came back truncated and callers must probe per file
+        """
+        url = f"{self.base_url}/repos/{repo}/git/trees/{branch}"
+        response = self._request("get", url, params={"recursive": "1"})
+        # Empty repositories and unborn branches 404/409 on the git-data
+        # endpoints; the Contents PUT still creates the first file
+        if response.status_code in (404, 409):
+            return {}
+        response.raise_for_status()
+        payload = response.json()
+        # A truncated listing would map missing paths to "does not
+        # exist" and produce sha-less updates that 422 on existing
+        # files; signal the caller to fall back to per-file probing
+        if payload.get("truncated"):
+            return None
+        return {
+            item["path"]: item["sha"]
+            for item in payload.get("tree", [])
+            if item.get("type") == "blob"
+        }
+
     def create_or_update_file(
         self,
         repo: str,
         path: str,
-        content: str,
+        content: Union[str, bytes],
         message: str,
-        branch: str = "main"
+        branch: str = "main",
+        known_sha: Any = _UNKNOWN,
+        encoded_content: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Create or update a file in the repository.
@@ -79,28 +334,35 @@ class GitHubWriteClient:
         Args:
             repo: Repository in 'owner/repo' format
             path: File path in repository
-            content: File content
+            content: File content (str, or bytes for binary payloads)
             message: Commit message
             branch: Branch name
+            known_sha: Blob SHA the caller already knows (None if the
+                file is known not to exist); skips the get_file probe
+            encoded_content: Pre-base64-encoded content; skips the
+                re-encode when the caller batched the encoding up front
 
         Returns:
             API response with commit details
         """
         url = f"{self.base_url}/repos/{repo}/contents/{path}"
 
-        # Check if file exists to get SHA
-        existing = self.get_file(repo, path, branch)
-        sha = existing.get("sha") if existing else None
+        if known_sha is _UNKNOWN:
+            # Check if file exists to get SHA
+            existing = self.get_file(repo, path, branch)
+            sha = existing.get("sha") if existing else None
+        else:
+            sha = known_sha
 
         data = {
             "message": message,
-            "content": base64.b64encode(content.encode()).decode(),
+            "content": encoded_content if encoded_content is not None else _b64_content(content),
             "branch": branch
         }
         if sha:
             data["sha"] = sha
 
-        response = requests.put(url, headers=self.headers, json=data)
+        response = self._request("put", url, json=data)
         response.raise_for_status()
         return response.json()
 
@@ -121,19 +383,133 @@ class GitHubWriteClient:
             branch: Branch name
 
         Returns:
-            List of API responses for each file
-        """
-        results = []
-        for path, content in files.items():
-            result = self.create_or_update_file(
-                repo=repo,
-                path=path,
-                content=content,
-                message=f"{message}: {path}",
-                branch=branch
-            )
-            results.append(result)
-        return results
+            List of API responses for each file, in input order
+
+        Note:
+            Deprecated for multi-file changesets - this path issues two
+            requests and produces one commit per file. Prefer
+            write_files_tree, which batches everything into one commit.
+        """
+        # One recursive tree fetch resolves every existing SHA up front,
+        # halving the request count versus a get_file probe per file
+        tree = self._prefetch_tree(repo, branch)
+
+        # Encode all payloads before the fan-out so base64 CPU never
+        # sits on the HTTP critical path inside a worker
+        encoded = [(path, _b64_content(content)) for path, content in files.items()]
+
+        def _write_one(path: str, payload: str) -> Dict[str, Any]:
+            with self._write_slots:
+                return self.create_or_update_file(
+                    repo=repo,
+                    path=path,
+                    content="",
+                    message=f"{message}: {path}",
+                    branch=branch,
+                    known_sha=tree.get(path) if tree is not None else _UNKNOWN,
+                    encoded_content=payload
+                )
+
+        # The work is network-bound (two round trips per file), so
+        # overlapping the waits dominates; results stay in input order
+        # because futures are collected in submission order
+        with ThreadPoolExecutor(max_workers=self.MAX_WRITE_WORKERS) as pool:
+            futures = [
+                pool.submit(_write_one, path, payload)
+                for path, payload in encoded
+            ]
+            return [future.result() for future in futures]
+
+    def write_files_tree(
+        self,
+        repo: str,
+        files: Dict[str, str],
+        message: str,
+        branch: str = "main"
+    ) -> Dict[str, Any]:
+        """
+        Write multiple files as a single commit via the Git Data API.
+
+        Instead of one GET+PUT (and one commit) per file through the
+        Contents API, this uploads all blobs, builds one tree, creates
+        one commit, and moves the branch ref - N+4 requests and a single
+        commit for N files, with no per-file SHA probes.
+
+        Args:
+            repo: Repository in 'owner/repo' format
+            files: Dict mapping paths to content
+            message: Commit message
+            branch: Branch name
+
+        Returns:
+            API response for the updated ref
+        """
+        # Resolve the branch head and its base tree
+        ref_url = f"{self.base_url}/repos/{repo}/git/ref/heads/{branch}"
+        response = self._request("get", ref_url)
+        response.raise_for_status()
+        head_sha = response.json()["object"]["sha"]
+
+        response = self._request(
+            "get",
+            f"{self.base_url}/repos/{repo}/git/commits/{head_sha}"
+        )
+        response.raise_for_status()
+        base_tree = response.json()["tree"]["sha"]
+
+        # Upload blobs; these are independent, so fan them out like
+        # write_files does
+        def _post_blob(content: str) -> str:
+            with self._write_slots:
+                resp = self._request(
+                    "post",
+                    f"{self.base_url}/repos/{repo}/git/blobs",
+                    json={
+                        "content": _b64_content(content),
+                        "encoding": "base64"
+                    }
+                )
+                resp.raise_for_status()
+                return resp.json()["sha"]
+
+        paths = list(files)
+        with ThreadPoolExecutor(max_workers=self.MAX_WRITE_WORKERS) as pool:
+            blob_shas = list(pool.map(_post_blob, (files[p] for p in paths)))
+
+        # One tree, one commit, one ref update
+        response = self._request(
+            "post",
+            f"{self.base_url}/repos/{repo}/git/trees",
+            json={
+                "base_tree": base_tree,
+                "tree": [
+                    {"path": path, "mode": "100644", "type": "blob", "sha": sha}
+                    for path, sha in zip(paths, blob_shas)
+                ]
+            }
+        )
+        response.raise_for_status()
+        tree_sha = response.json()["sha"]
+
+        response = self._request(
+            "post",
+            f"{self.base_url}/repos/{repo}/git/commits",
+            json={
+                "message": message,
+                "tree": tree_sha,
+                "parents": [head_sha]
+            }
+        )
+        response.raise_for_status()
+        commit_sha = response.json()["sha"]
+
+        response = self._request(
+            "patch",
+            f"{self.base_url}/repos/{repo}/git/refs/heads/{branch}",
+            json={"sha": commit_sha}
+        )
+        response.raise_for_status()
+        return response.json()
 
     def create_branch(
         self,
@@ -154,7 +530,7 @@ class GitHubWriteClient:
         """
         # Get SHA of source branch
         ref_url = f"{self.base_url}/repos/{repo}/git/ref/heads/{from_branch}"
-        response = requests.get(ref_url, headers=self.headers)
+        response = self._request("get", ref_url)
         response.raise_for_status()
         sha = response.json()["object"]["sha"]
 
@@ -164,7 +540,7 @@ class GitHubWriteClient:
             "ref": f"refs/heads/{branch_name}",
             "sha": sha
         }
-        response = requests.post(create_url, headers=self.headers, json=data)
+        response = self._request("post", create_url, json=data)
         response.raise_for_status()
         return response.json()
 
@@ -196,6 +572,6 @@ class GitHubWriteClient:
             "head": head,
             "base": base
         }
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self._request("post", url, json=data)
         response.raise_for_status()
         return response.json()
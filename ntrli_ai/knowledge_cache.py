@@ -9,28 +9,181 @@ enabling the system to work with previously gathered information
 when external sources are unavailable.
 """
 
+import functools
 import json
 import hashlib
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a cache entry (orjson when available, compact stdlib otherwise)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse a cache entry; raises ValueError on malformed data."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 # Default cache root directory
 CACHE_ROOT = Path("knowledge_cache")
 
+# Set once the cache directory is known to exist, so repeat calls skip
+# the stat + mkdir
+_dir_ready = False
+
 
 def _ensure_cache_dir() -> Path:
     """Ensure the cache directory exists."""
-    CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+    global _dir_ready
+    if not _dir_ready:
+        CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+        _dir_ready = True
     return CACHE_ROOT
 
 
+@functools.lru_cache(maxsize=4096)
 def _hash_key(topic: str) -> str:
     """Generate a hash key for a topic."""
     return hashlib.sha256(topic.encode()).hexdigest()
 
 
+# In-process read cache: hot keys come from this dict instead of a
+# disk read + parse. Entries are validated against the file's mtime so
+# out-of-band writes are still picked up.
+_MEM_CACHE_SIZE = 512
+_mem_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_mem_lock = threading.Lock()
+
+
+def _write_atomic(cache_file: Path, payload: bytes) -> None:
+    """
+    Write a cache file via temp-file-and-rename.
+
+    A crash mid-write would otherwise leave truncated JSON that every
+    later load silently discards, so the payload is fsynced to a
+    sibling temp file and swapped into place in one step.
+    """
+    tmp = cache_file.with_suffix(".json.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, cache_file)
+
+
+def _load_entry(key: str, cache_file: Path) -> Optional[Dict[str, Any]]:
+    """Load a cache entry, serving hot keys from memory."""
+    try:
+        mtime = cache_file.stat().st_mtime
+    except OSError:
+        return None
+
+    with _mem_lock:
+        hit = _mem_cache.get(key)
+        if hit is not None and hit[0] == mtime:
+            _mem_cache.move_to_end(key)
+            return hit[1]
+
+    try:
+        entry = _loads(cache_file.read_bytes())
+    except ValueError:
+        return None
+
+    with _mem_lock:
+        _mem_cache[key] = (mtime, entry)
+        _mem_cache.move_to_end(key)
+        while len(_mem_cache) > _MEM_CACHE_SIZE:
+            _mem_cache.popitem(last=False)
+    return entry
+
+
+def _topics_index() -> Path:
+    """Path of the append-only key -> topic sidecar index."""
+    return CACHE_ROOT / "_topics.tsv"
+
+
+def _backfill_index(index: Path) -> None:
+    """
+    Seed a brand-new sidecar from the legacy entry files.
+
+    Without this, the first store() on a pre-sidecar cache directory
+    would create an index holding only that one key, and list_topics
+    (which trusts an existing index) would hide every older topic.
+    """
+    lines = []
+    for cache_file in CACHE_ROOT.glob("*.json"):
+        try:
+            topic = _loads(cache_file.read_bytes())["topic"]
+        except (ValueError, KeyError):
+            continue
+        lines.append(f"{cache_file.stem}\t{json.dumps(topic)}\n")
+    index.write_text("".join(lines), encoding="utf-8")
+
+
+def _append_index(key: str, topic: Optional[str]) -> None:
+    """
+    Append an index line for a stored (or deleted) key.
+
+    Topics are JSON-encoded so tabs/newlines can't break the line
+    format; a missing topic records a tombstone for a delete.
+    """
+    index = _topics_index()
+    if not index.exists():
+        _backfill_index(index)
+    line = f"{key}\t{json.dumps(topic) if topic is not None else ''}\n"
+    with open(index, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+def _replay_index() -> Optional[Dict[str, str]]:
+    """
+    Replay the sidecar index into a key -> topic dict.
+
+    Returns None when no index exists (pre-sidecar cache directories
+    fall back to scanning the entry files).
+    """
+    try:
+        lines = _topics_index().read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return None
+
+    topics: Dict[str, str] = {}
+    for line in lines:
+        key, _, encoded = line.partition("\t")
+        if encoded:
+            topics[key] = json.loads(encoded)
+        else:
+            topics.pop(key, None)
+
+    # Compact once tombstones/rewrites dominate the log
+    if len(lines) > 2 * len(topics) + 16:
+        tmp = _topics_index().with_suffix(".tsv.tmp")
+        tmp.write_text(
+            "".join(f"{k}\t{json.dumps(t)}\n" for k, t in topics.items()),
+            encoding="utf-8"
+        )
+        tmp.replace(_topics_index())
+
+    return topics
+
+
 def store(topic: str, data: Any) -> str:
     """
     Store data in the knowledge cache.
@@ -53,7 +206,10 @@ def store(topic: str, data: Any) -> str:
         "version": 1
     }
 
-    cache_file.write_text(json.dumps(cache_entry, indent=2))
+    _write_atomic(cache_file, _dumps(cache_entry))
+    with _mem_lock:
+        _mem_cache.pop(key, None)
+    _append_index(key, topic)
     return key
 
 
@@ -69,16 +225,8 @@ def load(topic: str) -> Optional[Any]:
     """
     _ensure_cache_dir()
     key = _hash_key(topic)
-    cache_file = CACHE_ROOT / f"{key}.json"
-
-    if not cache_file.exists():
-        return None
-
-    try:
-        cached = json.loads(cache_file.read_text())
-        return cached.get("data")
-    except (json.JSONDecodeError, KeyError):
-        return None
+    cached = _load_entry(key, CACHE_ROOT / f"{key}.json")
+    return cached.get("data") if cached is not None else None
 
 
 def load_with_metadata(topic: str) -> Optional[Dict[str, Any]]:
@@ -93,15 +241,7 @@ def load_with_metadata(topic: str) -> Optional[Dict[str, Any]]:
     """
     _ensure_cache_dir()
     key = _hash_key(topic)
-    cache_file = CACHE_ROOT / f"{key}.json"
-
-    if not cache_file.exists():
-        return None
-
-    try:
-        return json.loads(cache_file.read_text())
-    except json.JSONDecodeError:
-        return None
+    return _load_entry(key, CACHE_ROOT / f"{key}.json")
 
 
 def exists(topic: str) -> bool:
@@ -125,6 +265,9 @@ def delete(topic: str) -> bool:
 
     if cache_file.exists():
         cache_file.unlink()
+        with _mem_lock:
+            _mem_cache.pop(key, None)
+        _append_index(key, None)
         return True
     return False
 
@@ -141,6 +284,9 @@ def clear_cache() -> int:
     for cache_file in CACHE_ROOT.glob("*.json"):
         cache_file.unlink()
         count += 1
+    _topics_index().unlink(missing_ok=True)
+    with _mem_lock:
+        _mem_cache.clear()
     return count
 
 
@@ -152,12 +298,19 @@ def list_topics() -> List[str]:
         List of topic strings
     """
     _ensure_cache_dir()
+
+    # The sidecar index answers this without parsing any entry file
+    indexed = _replay_index()
+    if indexed is not None:
+        return list(indexed.values())
+
+    # Legacy cache directory written before the index existed
     topics = []
     for cache_file in CACHE_ROOT.glob("*.json"):
         try:
-            cached = json.loads(cache_file.read_text())
+            cached = _loads(cache_file.read_bytes())
             topics.append(cached.get("topic", "unknown"))
-        except (json.JSONDecodeError, KeyError):
+        except (ValueError, KeyError):
             continue
     return topics
 
@@ -26,29 +26,41 @@ Environment Variables:
     GITHUB_TOKEN        - GitHub token for repository operations
 """
 
+import importlib
 import sys
-import json
 import os
 from typing import Dict
 
-# Import providers to trigger registration
-from providers.openai_adapter import OpenAIProvider
-from providers.claude_adapter import ClaudeProvider
-from providers.gemini_adapter import GeminiProvider
-from providers.groq_adapter import GroqProvider
-from providers.mistral_adapter import MistralProvider
-from providers.together_adapter import TogetherProvider
-from providers.replicate_adapter import ReplicateProvider
-from providers.deepseek_adapter import DeepSeekProvider
-from providers.huggingface_adapter import HuggingFaceProvider
-from providers.cohere_adapter import CohereProvider
-
 from providers.registry import get_provider
 from providers.router import Router, RouterStrategy
-from control_plane import ControlPlane
 
-# Import tools to trigger registration
-import tools
+
+# Provider initialization table:
+# (registry name, display name, adapter module, env var, kwargs)
+# Adapters register themselves on import, so each module (and whatever
+# vendor SDK it drags in) is only imported when its API key is set.
+# - openai: GPT-4o, o1 - best for general purpose
+# - claude: best for coding (93.7% accuracy)
+# - gemini: cheapest premium ($1.25/1M tokens)
+# - groq: FASTEST inference (276 tokens/sec)
+# - mistral: European compliance
+# - together: 3.5x faster, 20% cheaper
+# - replicate: open source models
+# - deepseek: ultra low cost ($0.14/1M)
+# - huggingface: custom models, free tier
+# - cohere: enterprise RAG
+PROVIDER_TABLE = (
+    ("openai", "OpenAI", "providers.openai_adapter", "OPENAI_API_KEY", {"model": "gpt-4o"}),
+    ("claude", "Claude", "providers.claude_adapter", "ANTHROPIC_API_KEY", {}),
+    ("gemini", "Gemini", "providers.gemini_adapter", "GOOGLE_API_KEY", {}),
+    ("groq", "Groq", "providers.groq_adapter", "GROQ_API_KEY", {}),
+    ("mistral", "Mistral", "providers.mistral_adapter", "MISTRAL_API_KEY", {}),
+    ("together", "Together", "providers.together_adapter", "TOGETHER_API_KEY", {}),
+    ("replicate", "Replicate", "providers.replicate_adapter", "REPLICATE_API_TOKEN", {}),
+    ("deepseek", "DeepSeek", "providers.deepseek_adapter", "DEEPSEEK_API_KEY", {}),
+    ("huggingface", "HuggingFace", "providers.huggingface_adapter", "HUGGINGFACE_API_KEY", {}),
+    ("cohere", "Cohere", "providers.cohere_adapter", "COHERE_API_KEY", {}),
+)
 
 
 def initialize_providers() -> Dict[str, object]:
@@ -60,81 +72,25 @@ def initialize_providers() -> Dict[str, object]:
     """
     providers = {}
 
-    # OpenAI (GPT-4o, o1) - Best for general purpose
-    if openai_key := os.getenv("OPENAI_API_KEY"):
-        try:
-            providers["openai"] = get_provider("openai", api_key=openai_key, model="gpt-4o")
-        except Exception as e:
-            print(f"Warning: Failed to initialize OpenAI: {e}", file=sys.stderr)
-
-    # Anthropic Claude - Best for coding (93.7% accuracy)
-    if claude_key := os.getenv("ANTHROPIC_API_KEY"):
-        try:
-            providers["claude"] = get_provider("claude", api_key=claude_key)
-        except Exception as e:
-            print(f"Warning: Failed to initialize Claude: {e}", file=sys.stderr)
-
-    # Google Gemini - Cheapest premium ($1.25/1M tokens)
-    if gemini_key := os.getenv("GOOGLE_API_KEY"):
-        try:
-            providers["gemini"] = get_provider("gemini", api_key=gemini_key)
-        except Exception as e:
-            print(f"Warning: Failed to initialize Gemini: {e}", file=sys.stderr)
-
-    # Groq - FASTEST inference (276 tokens/sec)
-    if groq_key := os.getenv("GROQ_API_KEY"):
-        try:
-            providers["groq"] = get_provider("groq", api_key=groq_key)
-        except Exception as e:
-            print(f"Warning: Failed to initialize Groq: {e}", file=sys.stderr)
-
-    # Mistral AI - European compliance
-    if mistral_key := os.getenv("MISTRAL_API_KEY"):
-        try:
-            providers["mistral"] = get_provider("mistral", api_key=mistral_key)
-        except Exception as e:
-            print(f"Warning: Failed to initialize Mistral: {e}", file=sys.stderr)
-
-    # Together AI - 3.5x faster, 20% cheaper
-    if together_key := os.getenv("TOGETHER_API_KEY"):
-        try:
-            providers["together"] = get_provider("together", api_key=together_key)
-        except Exception as e:
-            print(f"Warning: Failed to initialize Together: {e}", file=sys.stderr)
-
-    # Replicate - Open source models
-    if replicate_key := os.getenv("REPLICATE_API_TOKEN"):
-        try:
-            providers["replicate"] = get_provider("replicate", api_key=replicate_key)
-        except Exception as e:
-            print(f"Warning: Failed to initialize Replicate: {e}", file=sys.stderr)
-
-    # DeepSeek - Ultra low cost ($0.14/1M)
-    if deepseek_key := os.getenv("DEEPSEEK_API_KEY"):
-        try:
-            providers["deepseek"] = get_provider("deepseek", api_key=deepseek_key)
-        except Exception as e:
-            print(f"Warning: Failed to initialize DeepSeek: {e}", file=sys.stderr)
-
-    # Hugging Face - Custom models, free tier
-    if hf_key := os.getenv("HUGGINGFACE_API_KEY"):
-        try:
-            providers["huggingface"] = get_provider("huggingface", api_key=hf_key)
-        except Exception as e:
-            print(f"Warning: Failed to initialize HuggingFace: {e}", file=sys.stderr)
-
-    # Cohere - Enterprise RAG
-    if cohere_key := os.getenv("COHERE_API_KEY"):
-        try:
-            providers["cohere"] = get_provider("cohere", api_key=cohere_key)
-        except Exception as e:
-            print(f"Warning: Failed to initialize Cohere: {e}", file=sys.stderr)
+    for name, display_name, module, env_var, kwargs in PROVIDER_TABLE:
+        if api_key := os.getenv(env_var):
+            try:
+                importlib.import_module(module)
+                providers[name] = get_provider(name, api_key=api_key, **kwargs)
+            except Exception as e:
+                print(f"Warning: Failed to initialize {display_name}: {e}", file=sys.stderr)
 
     return providers
 
 
 def main():
     """Main entry point for NTRLI' AI."""
+    # Deferred so a bad invocation (usage error, no keys) exits before
+    # paying for the control plane, tool registration, or json
+    import json
+    from control_plane import ControlPlane
+    import tools  # noqa: F401 - imported to trigger tool registration
+
     # Initialize providers
     providers = initialize_providers()
 
@@ -44,29 +44,9 @@ class NotebookQueryEngine:
         Returns:
             List of matching entries
         """
-        query_lower = query.lower()
-        results = []
-
-        for entry_meta in self.store.list_entries(entry_type):
-            # Check title match
-            if query_lower in entry_meta["title"].lower():
-                entry = self.store.get_entry(entry_meta["id"])
-                if entry:
-                    results.append(entry)
-                continue
-
-            # Check tag match
-            for tag in entry_meta.get("tags", []):
-                if query_lower in tag.lower():
-                    entry = self.store.get_entry(entry_meta["id"])
-                    if entry:
-                        results.append(entry)
-                    break
-
-            if len(results) >= limit:
-                break
-
-        return results[:limit]
+        # Delegates to the store's full-text index - one indexed query
+        # instead of a Python scan over every entry plus a per-hit load
+        return self.store.search_text(query, entry_type=entry_type, limit=limit)
 
     def get_recent(
         self,
@@ -83,18 +63,9 @@ class NotebookQueryEngine:
         Returns:
             List of recent entries
         """
-        entries = self.store.list_entries(entry_type)
-
-        # Sort by created_at descending
-        entries.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-
-        results = []
-        for entry_meta in entries[:limit]:
-            entry = self.store.get_entry(entry_meta["id"])
-            if entry:
-                results.append(entry)
-
-        return results
+        # One ordered, limited query replaces the full summary listing,
+        # Python-side sort, and per-ID entry loads
+        return self.store.get_recent_entries(limit=limit, entry_type=entry_type)
 
     def get_by_tags(
         self,
@@ -113,14 +84,16 @@ class NotebookQueryEngine:
         """
         if match_all:
             # Find entries with all tags
-            result_sets = [set(self.store._index["tags"].get(tag, [])) for tag in tags]
+            result_sets = [set(self.store.tag_ids(tag)) for tag in tags]
             if not result_sets:
                 return []
-            common_ids = result_sets[0].intersection(*result_sets[1:])
-            return [self.store.get_entry(eid) for eid in common_ids if self.store.get_entry(eid)]
+            ids = result_sets[0].intersection(*result_sets[1:])
         else:
             # Find entries with any tag
-            all_ids = set()
+            ids = set()
             for tag in tags:
-                all_ids.update(self.store._index["tags"].get(tag, []))
-            return [self.store.get_entry(eid) for eid in all_ids if self.store.get_entry(eid)]
+                ids.update(self.store.tag_ids(tag))
+
+        # One batched fetch; the old per-ID form loaded every candidate
+        # twice (once in the filter, once for the value)
+        return self.store.get_entries(list(ids))
@@ -6,12 +6,20 @@ Notebook store for persistent knowledge storage.
 
 Provides structured storage for research results, code snippets,
 and other artifacts that need to persist across sessions.
+
+Entries live in a single SQLite database instead of one JSON file per
+entry plus a rewritten index.json: an add is one transactional insert,
+and tag/type lookups are indexed SELECTs instead of directory walks
+with a JSON parse per file.
 """
 
 import json
+import sqlite3
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 class NotebookStore:
@@ -30,18 +38,189 @@ class NotebookStore:
         """
         self.store_dir = Path(store_dir)
         self.store_dir.mkdir(parents=True, exist_ok=True)
-        self._index_file = self.store_dir / "index.json"
-        self._index = self._load_index()
+        self._db_path = self.store_dir / "notebook.sqlite"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._init_db()
+        self._import_legacy()
+
+    def _init_db(self) -> None:
+        """Create tables and indices if they don't exist."""
+        # WAL appends each add to the log instead of rewriting pages in
+        # place, and NORMAL sync skips the per-commit fsync of the main
+        # db file - the WAL itself still guarantees durability
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    content TEXT,
+                    tags TEXT,
+                    title_lc TEXT,
+                    tags_lc TEXT,
+                    created_at_ns INTEGER,
+                    created_at TEXT,
+                    updated_at TEXT
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS entry_tags (
+                    entry_id TEXT NOT NULL,
+                    tag TEXT NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entry_tags_tag"
+                " ON entry_tags(tag)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entries_type_created"
+                " ON entries(type, created_at DESC)"
+            )
+
+        # Databases created before these columns existed
+        for column, col_type in (
+            ("title_lc", "TEXT"),
+            ("tags_lc", "TEXT"),
+            ("created_at_ns", "INTEGER"),
+        ):
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        f"ALTER TABLE entries ADD COLUMN {column} {col_type}"
+                    )
+            except sqlite3.OperationalError:
+                pass
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_created_ns"
+            " ON entries(created_at_ns DESC)"
+        )
+
+        # Full-text index over title/content/tags, kept in sync by
+        # triggers. FTS5 ships with virtually every SQLite build; if
+        # this one lacks it, search_text falls back to a LIKE scan.
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts"
+                    " USING fts5(title, content, tags,"
+                    " content='entries', content_rowid='rowid')"
+                )
+                self._conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS entries_fts_insert
+                    AFTER INSERT ON entries BEGIN
+                        INSERT INTO entries_fts (rowid, title, content, tags)
+                        VALUES (new.rowid, new.title, new.content, new.tags);
+                    END
+                """)
+                self._conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS entries_fts_delete
+                    AFTER DELETE ON entries BEGIN
+                        INSERT INTO entries_fts
+                            (entries_fts, rowid, title, content, tags)
+                        VALUES
+                            ('delete', old.rowid, old.title, old.content, old.tags);
+                    END
+                """)
+                self._conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS entries_fts_update
+                    AFTER UPDATE ON entries BEGIN
+                        INSERT INTO entries_fts
+                            (entries_fts, rowid, title, content, tags)
+                        VALUES
+                            ('delete', old.rowid, old.title, old.content, old.tags);
+                        INSERT INTO entries_fts (rowid, title, content, tags)
+                        VALUES (new.rowid, new.title, new.content, new.tags);
+                    END
+                """)
+            self._fts = True
+        except sqlite3.OperationalError:
+            self._fts = False
 
-    def _load_index(self) -> Dict[str, Any]:
-        """Load or create the index."""
-        if self._index_file.exists():
-            return json.loads(self._index_file.read_text())
-        return {"entries": {}, "tags": {}}
+    def _import_legacy(self) -> None:
+        """
+        One-time import of a pre-SQLite store directory.
+
+        Earlier versions kept one JSON file per entry plus an
+        index.json; without this, upgrading would silently present an
+        empty notebook. Entries already present in the database are
+        skipped, so the import is idempotent.
+        """
+        index_file = self.store_dir / "index.json"
+        if not index_file.exists():
+            return
 
-    def _save_index(self) -> None:
-        """Save the index to disk."""
-        self._index_file.write_text(json.dumps(self._index, indent=2))
+        try:
+            index = json.loads(index_file.read_text())
+        except ValueError:
+            return
+
+        with self._lock, self._conn:
+            for entry_id in index.get("entries", {}):
+                if self._conn.execute(
+                    "SELECT 1 FROM entries WHERE id = ?", (entry_id,)
+                ).fetchone():
+                    continue
+                try:
+                    entry = json.loads(
+                        (self.store_dir / f"{entry_id}.json").read_text()
+                    )
+                except (OSError, ValueError):
+                    continue
+
+                title = entry.get("title", "")
+                tags = entry.get("tags") or []
+                created_at = entry.get("created_at", "")
+                # Legacy stamps are naive UTC; recover the ns value so
+                # recency ordering interleaves old and new rows
+                try:
+                    created_at_ns = int(
+                        datetime.fromisoformat(created_at)
+                        .replace(tzinfo=timezone.utc)
+                        .timestamp() * 1e9
+                    )
+                except ValueError:
+                    created_at_ns = None
+
+                self._conn.execute(
+                    "INSERT INTO entries"
+                    " (id, title, type, content, tags,"
+                    " title_lc, tags_lc, created_at_ns, created_at, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        entry_id,
+                        title,
+                        entry.get("type", "note"),
+                        json.dumps(entry.get("content")),
+                        json.dumps(tags),
+                        title.lower(),
+                        " ".join(tags).lower(),
+                        created_at_ns,
+                        created_at,
+                        entry.get("updated_at", created_at)
+                    )
+                )
+                self._conn.executemany(
+                    "INSERT INTO entry_tags (entry_id, tag) VALUES (?, ?)",
+                    [(entry_id, tag) for tag in tags]
+                )
+
+    @staticmethod
+    def _row_to_entry(row: sqlite3.Row) -> Dict[str, Any]:
+        """Rebuild the public entry dict from a database row."""
+        return {
+            "id": row["id"],
+            "title": row["title"],
+            "content": json.loads(row["content"]),
+            "type": row["type"],
+            "tags": json.loads(row["tags"]),
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"]
+        }
 
     def add_entry(
         self,
@@ -62,37 +241,48 @@ class NotebookStore:
         Returns:
             Entry ID
         """
-        entry_id = f"{datetime.utcnow().strftime('%Y%m%d%H%M%S')}_{len(self._index['entries'])}"
-
-        entry = {
-            "id": entry_id,
-            "title": title,
-            "content": content,
-            "type": entry_type,
-            "tags": tags or [],
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat()
-        }
+        tags = tags or []
 
-        # Save entry file
-        entry_file = self.store_dir / f"{entry_id}.json"
-        entry_file.write_text(json.dumps(entry, indent=2))
+        with self._lock:
+            count = self._conn.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()[0]
 
-        # Update index
-        self._index["entries"][entry_id] = {
-            "title": title,
-            "type": entry_type,
-            "tags": tags or [],
-            "created_at": entry["created_at"]
-        }
+            # One clock read; the ID stamp and the ISO strings are all
+            # derived from it
+            created_at_ns = time.time_ns()
+            # Naive UTC, matching existing rows; utcfromtimestamp is
+            # deprecated
+            created = datetime.fromtimestamp(
+                created_at_ns / 1e9, tz=timezone.utc
+            ).replace(tzinfo=None)
+            entry_id = f"{created.strftime('%Y%m%d%H%M%S')}_{count}"
+            created_at = created.isoformat()
 
-        # Update tag index
-        for tag in (tags or []):
-            if tag not in self._index["tags"]:
-                self._index["tags"][tag] = []
-            self._index["tags"][tag].append(entry_id)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO entries"
+                    " (id, title, type, content, tags,"
+                    " title_lc, tags_lc, created_at_ns, created_at, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        entry_id,
+                        title,
+                        entry_type,
+                        json.dumps(content),
+                        json.dumps(tags),
+                        title.lower(),
+                        " ".join(tags).lower(),
+                        created_at_ns,
+                        created_at,
+                        created_at
+                    )
+                )
+                self._conn.executemany(
+                    "INSERT INTO entry_tags (entry_id, tag) VALUES (?, ?)",
+                    [(entry_id, tag) for tag in tags]
+                )
 
-        self._save_index()
         return entry_id
 
     def get_entry(self, entry_id: str) -> Optional[Dict[str, Any]]:
@@ -105,10 +295,130 @@ class NotebookStore:
         Returns:
             Entry dict or None if not found
         """
-        entry_file = self.store_dir / f"{entry_id}.json"
-        if entry_file.exists():
-            return json.loads(entry_file.read_text())
-        return None
+        row = self._conn.execute(
+            "SELECT * FROM entries WHERE id = ?", (entry_id,)
+        ).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def get_entries(self, entry_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get multiple entries in one query.
+
+        Args:
+            entry_ids: The entry IDs to fetch
+
+        Returns:
+            List of found entries, in the order requested (missing IDs
+            are skipped)
+        """
+        if not entry_ids:
+            return []
+        placeholders = ",".join("?" * len(entry_ids))
+        rows = self._conn.execute(
+            f"SELECT * FROM entries WHERE id IN ({placeholders})",
+            entry_ids
+        ).fetchall()
+        by_id = {row["id"]: self._row_to_entry(row) for row in rows}
+        return [by_id[eid] for eid in entry_ids if eid in by_id]
+
+    def get_recent_entries(
+        self,
+        limit: int = 10,
+        entry_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the most recent full entries in one query.
+
+        Args:
+            limit: Maximum results
+            entry_type: Optional type filter
+
+        Returns:
+            List of entries, newest first
+        """
+        # coalesce keeps rows from databases that predate created_at_ns
+        # in the ordering via their ISO string
+        sql = "SELECT * FROM entries"
+        params: List[Any] = []
+        if entry_type is not None:
+            sql += " WHERE type = ?"
+            params.append(entry_type)
+        sql += " ORDER BY coalesce(created_at_ns, 0) DESC, created_at DESC LIMIT ?"
+        params.append(limit)
+        rows = self._conn.execute(sql, params).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def search_text(
+        self,
+        query: str,
+        entry_type: Optional[str] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Full-text search across titles, content, and tags.
+
+        Uses the FTS5 index (sub-linear, prefix-matched) when available,
+        otherwise a LIKE scan over title and tags.
+
+        Args:
+            query: Search query
+            entry_type: Optional type filter
+            limit: Maximum results to return
+
+        Returns:
+            List of matching entries
+        """
+        if self._fts:
+            match = '"' + query.replace('"', '""') + '"*'
+            sql = (
+                "SELECT entries.* FROM entries_fts"
+                " JOIN entries ON entries.rowid = entries_fts.rowid"
+                " WHERE entries_fts MATCH ?"
+            )
+            params: List[Any] = [match]
+            if entry_type is not None:
+                sql += " AND entries.type = ?"
+                params.append(entry_type)
+            sql += " LIMIT ?"
+            params.append(limit)
+            try:
+                rows = self._conn.execute(sql, params).fetchall()
+                return [self._row_to_entry(row) for row in rows]
+            except sqlite3.OperationalError:
+                # Query not parseable as an FTS expression - fall back
+                pass
+
+        # Lowercasing happened once at insert time; coalesce covers rows
+        # written before those columns existed
+        pattern = f"%{query.lower()}%"
+        sql = (
+            "SELECT * FROM entries"
+            " WHERE (coalesce(title_lc, lower(title)) LIKE ?"
+            " OR coalesce(tags_lc, lower(tags)) LIKE ?)"
+        )
+        params = [pattern, pattern]
+        if entry_type is not None:
+            sql += " AND type = ?"
+            params.append(entry_type)
+        sql += " LIMIT ?"
+        params.append(limit)
+        rows = self._conn.execute(sql, params).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def tag_ids(self, tag: str) -> List[str]:
+        """
+        Get the IDs of all entries carrying a tag.
+
+        Args:
+            tag: Tag to look up
+
+        Returns:
+            List of entry IDs
+        """
+        rows = self._conn.execute(
+            "SELECT entry_id FROM entry_tags WHERE tag = ?", (tag,)
+        ).fetchall()
+        return [row["entry_id"] for row in rows]
 
     def search_by_tag(self, tag: str) -> List[Dict[str, Any]]:
         """
@@ -120,8 +430,13 @@ class NotebookStore:
         Returns:
             List of matching entries
         """
-        entry_ids = self._index["tags"].get(tag, [])
-        return [self.get_entry(eid) for eid in entry_ids if self.get_entry(eid)]
+        rows = self._conn.execute(
+            "SELECT entries.* FROM entries"
+            " JOIN entry_tags ON entry_tags.entry_id = entries.id"
+            " WHERE entry_tags.tag = ?",
+            (tag,)
+        ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
 
     def list_entries(self, entry_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -133,8 +448,27 @@ class NotebookStore:
         Returns:
             List of entry summaries
         """
-        entries = []
-        for entry_id, meta in self._index["entries"].items():
-            if entry_type is None or meta["type"] == entry_type:
-                entries.append({"id": entry_id, **meta})
-        return entries
+        if entry_type is None:
+            rows = self._conn.execute(
+                "SELECT id, title, type, tags, created_at FROM entries"
+            ).fetchall()
+        else:
+            rows = self._conn.execute(
+                "SELECT id, title, type, tags, created_at FROM entries"
+                " WHERE type = ?",
+                (entry_type,)
+            ).fetchall()
+        return [
+            {
+                "id": row["id"],
+                "title": row["title"],
+                "type": row["type"],
+                "tags": json.loads(row["tags"]),
+                "created_at": row["created_at"]
+            }
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
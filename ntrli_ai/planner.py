@@ -13,10 +13,20 @@ If planning fails, execution MUST halt.
 """
 
 import json
+import re
 from typing import List, Dict, Any
-from jsonschema import validate, ValidationError
 from providers.router import Router
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # JSON Schema for plan validation
 PLAN_SCHEMA = {
@@ -46,11 +56,67 @@ PLAN_SCHEMA = {
 }
 
 
+# PLAN_SCHEMA is frozen for the life of the process, so the validator
+# is built exactly once at import instead of re-walking the schema on
+# every plan() call. fastjsonschema code-generates the checks; the
+# jsonschema fallback still reuses one prepared validator instance.
+if fastjsonschema is not None:
+    _validate_plan = fastjsonschema.compile(PLAN_SCHEMA)
+    _VALIDATION_ERROR = fastjsonschema.JsonSchemaException
+else:
+    from jsonschema import Draft7Validator, ValidationError
+
+    _validate_plan = Draft7Validator(PLAN_SCHEMA).validate
+    _VALIDATION_ERROR = ValidationError
+
+
 class PlanningError(RuntimeError):
     """Raised when planning fails - execution MUST halt."""
     pass
 
 
+# Static halves of the planning prompt, allocated once; plan() only
+# pays for one concatenation around the instruction
+_PROMPT_PREFIX = """You are a deterministic planning engine.
+Return ONLY valid JSON. No commentary. No markdown. No explanations.
+
+Decompose this task into ordered steps.
+
+ALLOWED ACTIONS:
+- research: Web research for gathering information
+- notebook_query: Query the knowledge cache
+- code_generate: Generate code files based on specification
+- code_validate: Validate Python code syntax
+- run_tests: Execute test suite
+- code_execute: Run code in isolated sandbox
+- artifact_write: Write output files to disk
+- github_writeback: Write files to GitHub repository
+
+TASK:
+"""
+
+_PROMPT_SUFFIX = """
+
+REQUIRED FORMAT (JSON only, no other text):
+{"steps": [{"action": "research", "payload": {"query": "..."}}, {"action": "code_generate", "payload": {"spec": "..."}}]}
+"""
+
+
+# Pulls the JSON object out of a response: the body of a fenced
+# ```json block, or the outermost braces when no fence is present.
+# Two patterns, tried fence-first - a single alternation would let a
+# stray '{' earlier in the text shadow a later fenced block
+_FENCED_JSON = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_BARE_JSON = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 class Planner:
     """
     Plan-first enforcement engine.
@@ -83,27 +149,7 @@ class Planner:
         Raises:
             PlanningError: If planning fails
         """
-        prompt = f"""You are a deterministic planning engine.
-Return ONLY valid JSON. No commentary. No markdown. No explanations.
-
-Decompose this task into ordered steps.
-
-ALLOWED ACTIONS:
-- research: Web research for gathering information
-- notebook_query: Query the knowledge cache
-- code_generate: Generate code files based on specification
-- code_validate: Validate Python code syntax
-- run_tests: Execute test suite
-- code_execute: Run code in isolated sandbox
-- artifact_write: Write output files to disk
-- github_writeback: Write files to GitHub repository
-
-TASK:
-{instruction}
-
-REQUIRED FORMAT (JSON only, no other text):
-{{"steps": [{{"action": "research", "payload": {{"query": "..."}}}}, {{"action": "code_generate", "payload": {{"spec": "..."}}}}]}}
-"""
+        prompt = _PROMPT_PREFIX + instruction + _PROMPT_SUFFIX
 
         outputs = self.router.generate(prompt, temperature=0.0)
 
@@ -115,31 +161,22 @@ REQUIRED FORMAT (JSON only, no other text):
             try:
                 # Extract JSON from potential markdown code blocks
                 parsed_text = self._extract_json(text)
-                data = json.loads(parsed_text)
-                validate(instance=data, schema=PLAN_SCHEMA)
+                data = _loads(parsed_text)
+                _validate_plan(data)
                 return data["steps"]
 
-            except (json.JSONDecodeError, ValidationError):
+            # ValueError covers both json and orjson decode failures
+            except (ValueError, _VALIDATION_ERROR):
                 continue
 
         raise PlanningError("All providers failed to generate valid plan")
 
     def _extract_json(self, text: str) -> str:
         """Extract JSON from potential markdown code blocks."""
-        text = text.strip()
-
-        # Remove markdown code blocks
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            parts = text.split("```")
-            if len(parts) >= 2:
-                text = parts[1].strip()
-
-        # Try to find JSON object boundaries
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start != -1 and end > start:
-            text = text[start:end]
-
-        return text
+        m = _FENCED_JSON.search(text)
+        if m:
+            return m.group(1)
+        m = _BARE_JSON.search(text)
+        if m:
+            return m.group(0)
+        return text.strip()
@@ -8,9 +8,14 @@ All providers must implement the generate() method with deterministic
 defaults (temperature=0.0) to ensure consistent, reproducible behavior.
 """
 
+import asyncio
+import hashlib
+import json
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from .cache import get_llm_cache
+
 
 class LLMProvider(ABC):
     """Base class for all LLM providers."""
@@ -29,6 +34,58 @@ class LLMProvider(ABC):
         """
         pass
 
+    def _cached_generate(self, prompt: str, temperature: float = 0.0) -> str:
+        """
+        Generate with an exact-match cache for deterministic calls.
+
+        At temperature 0 the same (provider, model, prompt) always
+        yields the same completion, so a hit skips the network round
+        trip entirely. Sampled calls (temperature > 0) bypass the cache.
+
+        Args:
+            prompt: The input prompt
+            temperature: Sampling temperature
+
+        Returns:
+            Generated (or cached) text response
+        """
+        if temperature > 0:
+            return self.generate(prompt, temperature)
+
+        key = hashlib.sha256(json.dumps({
+            "c": self.__class__.__name__,
+            "m": getattr(self, "model", None),
+            "p": prompt,
+            "t": temperature
+        }, sort_keys=True).encode()).hexdigest()
+
+        cache = get_llm_cache()
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        text = self.generate(prompt, temperature)
+        cache.set(key, text)
+        return text
+
+    async def agenerate(self, prompt: str, temperature: float = 0.0) -> str:
+        """
+        Async variant of generate.
+
+        The default runs the (cached) blocking call in a worker thread
+        so any adapter is immediately usable from an event loop;
+        adapters with a native async SDK client override this to drive
+        the request on the loop itself.
+
+        Args:
+            prompt: The input prompt
+            temperature: Sampling temperature (0.0 for deterministic)
+
+        Returns:
+            Generated text response
+        """
+        return await asyncio.to_thread(self._cached_generate, prompt, temperature)
+
     def get_model_info(self) -> dict:
         """Return information about the current model configuration."""
         return {
@@ -0,0 +1,139 @@
+# ============================================================================
+# NTRLI' AI - LLM RESPONSE CACHE
+# ============================================================================
+"""
+Content-addressed cache for deterministic LLM responses.
+
+At temperature 0 a (provider, model, prompt) triple always maps to the
+same completion, so an exact-match cache can serve repeat calls - the
+fallback and consensus router paths replay identical prompts - without
+an HTTP round trip. Entries live in an in-process LRU backed by an
+optional on-disk layer that survives restarts.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+
+class LLMCache:
+    """
+    Two-level (memory + disk) cache for generated text.
+
+    Keys are content hashes computed by the caller; values are the raw
+    completion strings. Disk failures are non-fatal - the cache then
+    simply behaves as memory-only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: float = 7 * 24 * 3600
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum in-memory entries (LRU-evicted)
+            cache_dir: Directory for the persistent layer (defaults to
+                ~/.cache/ntrli_ai/llm)
+            ttl_seconds: Age after which disk entries are ignored
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir or Path.home() / ".cache" / "ntrli_ai" / "llm"
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dir_ready = False
+
+    def _ensure_dir(self) -> bool:
+        """Create the disk layer's directory once; False if unusable."""
+        if not self._dir_ready:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                return False
+            self._dir_ready = True
+        return True
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached completion.
+
+        Args:
+            key: Content hash of the request
+
+        Returns:
+            The cached text, or None on miss/expiry
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        path = self.cache_dir / f"{key}.json"
+        try:
+            entry = json.loads(path.read_bytes())
+            if time.time() - entry["stored_at"] > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            text = entry["text"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return text
+
+    def set(self, key: str, text: str) -> None:
+        """
+        Store a completion.
+
+        Args:
+            key: Content hash of the request
+            text: The completion to cache
+        """
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        if self._ensure_dir():
+            try:
+                (self.cache_dir / f"{key}.json").write_text(
+                    json.dumps({"text": text, "stored_at": time.time()})
+                )
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and delete the disk layer."""
+        with self._lock:
+            self._entries.clear()
+        try:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink()
+        except OSError:
+            pass
+
+
+_default_cache: Optional[LLMCache] = None
+_default_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMCache:
+    """Get the process-wide shared LLM cache."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = LLMCache()
+    return _default_cache
@@ -28,6 +28,7 @@ class ClaudeProvider(LLMProvider):
         self.api_key = api_key
         self.model = model
         self._client = None
+        self._async_client = None
 
     @property
     def client(self):
@@ -37,6 +38,14 @@ class ClaudeProvider(LLMProvider):
             self._client = anthropic.Anthropic(api_key=self.api_key)
         return self._client
 
+    @property
+    def async_client(self):
+        """Lazy-load the async Anthropic client."""
+        if self._async_client is None:
+            import anthropic
+            self._async_client = anthropic.AsyncAnthropic(api_key=self.api_key)
+        return self._async_client
+
     def generate(self, prompt: str, temperature: float = 0.0) -> str:
         """Generate text using Anthropic API."""
         message = self.client.messages.create(
@@ -46,3 +55,13 @@ class ClaudeProvider(LLMProvider):
             messages=[{"role": "user", "content": prompt}]
         )
         return message.content[0].text
+
+    async def agenerate(self, prompt: str, temperature: float = 0.0) -> str:
+        """Generate text using the async Anthropic API (no worker thread)."""
+        message = await self.async_client.messages.create(
+            model=self.model,
+            max_tokens=4096,
+            temperature=temperature,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return message.content[0].text
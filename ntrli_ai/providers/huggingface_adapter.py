@@ -9,11 +9,25 @@ Best for: Custom models, research, free tier experimentation
 Pricing: FREE tier + Inference Endpoints ($0.60-$4/hr)
 """
 
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .registry import register
 from .base import LLMProvider
 
 
+# One shared session keeps the connection pool (and its TLS sessions)
+# warm across calls instead of paying a fresh handshake per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
+atexit.register(_SESSION.close)
+
+
 @register("huggingface")
 class HuggingFaceProvider(LLMProvider):
     """Hugging Face Inference API provider."""
@@ -42,7 +56,7 @@ class HuggingFaceProvider(LLMProvider):
             }
         }
 
-        response = requests.post(
+        response = _SESSION.post(
             self.api_url,
             headers=headers,
             json=payload,
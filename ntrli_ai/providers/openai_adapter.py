@@ -28,6 +28,7 @@ class OpenAIProvider(LLMProvider):
         self.api_key = api_key
         self.model = model
         self._client = None
+        self._async_client = None
 
     @property
     def client(self):
@@ -37,6 +38,14 @@ class OpenAIProvider(LLMProvider):
             self._client = OpenAI(api_key=self.api_key)
         return self._client
 
+    @property
+    def async_client(self):
+        """Lazy-load the async OpenAI client."""
+        if self._async_client is None:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(api_key=self.api_key)
+        return self._async_client
+
     def generate(self, prompt: str, temperature: float = 0.0) -> str:
         """Generate text using OpenAI API."""
         response = self.client.chat.completions.create(
@@ -45,3 +54,12 @@ class OpenAIProvider(LLMProvider):
             temperature=temperature
         )
         return response.choices[0].message.content or ""
+
+    async def agenerate(self, prompt: str, temperature: float = 0.0) -> str:
+        """Generate text using the async OpenAI API (no worker thread)."""
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature
+        )
+        return response.choices[0].message.content or ""
@@ -8,11 +8,16 @@ Providers register themselves using the @register decorator.
 The system can only use providers that are explicitly registered here.
 """
 
-from typing import Dict, Type, Callable
+from typing import Dict, Tuple, Type, Callable
 from .base import LLMProvider
 
 _REGISTRY: Dict[str, Type[LLMProvider]] = {}
 
+# Instance cache keyed by (name, sorted constructor kwargs); providers
+# hold API keys and lazily built SDK clients, so the same configuration
+# should map to one instance rather than a fresh client per call
+_INSTANCES: Dict[Tuple, LLMProvider] = {}
+
 
 def register(name: str) -> Callable[[Type[LLMProvider]], Type[LLMProvider]]:
     """
@@ -39,6 +44,11 @@ def get_provider(name: str, **kwargs) -> LLMProvider:
     """
     Get an instance of a registered provider.
 
+    Instances are memoized per (name, kwargs) configuration, so repeated
+    calls with the same arguments return the same object and reuse its
+    connection pools and lazily built SDK clients. Callers must not
+    mutate the configuration of a returned instance.
+
     Args:
         name: The provider name
         **kwargs: Arguments to pass to the provider constructor
@@ -52,7 +62,17 @@ def get_provider(name: str, **kwargs) -> LLMProvider:
     if name not in _REGISTRY:
         available = ", ".join(_REGISTRY.keys()) or "none"
         raise ValueError(f"Unknown provider: {name}. Available: {available}")
-    return _REGISTRY[name](**kwargs)
+    key = (name, tuple(sorted(kwargs.items())))
+    instance = _INSTANCES.get(key)
+    if instance is None:
+        instance = _REGISTRY[name](**kwargs)
+        _INSTANCES[key] = instance
+    return instance
+
+
+def clear_provider_cache() -> None:
+    """Drop all memoized provider instances (e.g. after key rotation)."""
+    _INSTANCES.clear()
 
 
 def list_providers() -> list[str]:
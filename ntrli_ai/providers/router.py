@@ -12,7 +12,10 @@ Supports multiple strategies:
 - FALLBACK: Try providers in order until success
 """
 
-from typing import Dict, List
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Dict, List, Optional
 from .base import LLMProvider
 
 
@@ -32,15 +35,43 @@ class Router:
     Routes requests to LLM providers based on strategy.
     """
 
-    def __init__(self, providers: Dict[str, LLMProvider]):
+    # Per-provider p99-ish ceilings; SDK defaults can block for many
+    # minutes, which would stall the whole fallback chain
+    DEFAULT_TIMEOUTS = {
+        "groq": 5.0,
+        "openai": 30.0,
+        "claude": 45.0,
+        "huggingface": 60.0,
+    }
+    DEFAULT_TIMEOUT = 30.0
+
+    # Smoothing factor for the observed-latency EMA
+    _LATENCY_ALPHA = 0.3
+
+    # Observations faster than this are LLM-cache hits that never
+    # touched the network; feeding them into the EMA would collapse
+    # _timeout_for and make the next uncached call spuriously time out
+    _MIN_RECORDED_LATENCY = 0.05
+
+    def __init__(
+        self,
+        providers: Dict[str, LLMProvider],
+        timeouts: Optional[Dict[str, float]] = None
+    ):
         """
         Initialize router with available providers.
 
         Args:
             providers: Dictionary mapping provider names to instances
+            timeouts: Optional per-provider timeout overrides in seconds
         """
         self.providers = providers
         self.primary = list(providers.keys())[0] if providers else None
+        self.timeouts = dict(self.DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self._latency_ema: Dict[str, float] = {}
+        self._call_pool: Optional[ThreadPoolExecutor] = None
 
         # Provider rankings by category (from web research benchmarks)
         self.rankings = {
@@ -50,6 +81,103 @@ class Router:
             "coding": ["claude", "openai", "deepseek", "mistral", "groq"]
         }
 
+        # Rankings and the configured provider set are fixed for the
+        # router's lifetime, so the per-strategy order (already filtered
+        # to configured providers) is computed once instead of rebuilt
+        # and re-checked on every generate call
+        self._ordered = {
+            RouterStrategy.FASTEST: tuple(
+                n for n in self.rankings["speed"] if n in providers
+            ),
+            RouterStrategy.CHEAPEST: tuple(
+                n for n in self.rankings["cost"] if n in providers
+            ),
+            RouterStrategy.SMARTEST: tuple(
+                n for n in self.rankings["quality"] if n in providers
+            ),
+        }
+
+    def record_latency(self, name: str, seconds: float) -> None:
+        """
+        Feed an observed call latency into the provider's EMA.
+
+        Sub-threshold observations (cache hits) are discarded so the
+        EMA keeps tracking real network round trips.
+
+        Args:
+            name: Provider name
+            seconds: Observed wall-clock latency
+        """
+        if seconds < self._MIN_RECORDED_LATENCY:
+            return
+        previous = self._latency_ema.get(name)
+        if previous is None:
+            self._latency_ema[name] = seconds
+        else:
+            self._latency_ema[name] = (
+                self._LATENCY_ALPHA * seconds
+                + (1 - self._LATENCY_ALPHA) * previous
+            )
+
+    def _timeout_for(self, name: str) -> float:
+        """Effective timeout: the configured ceiling, tightened by the EMA."""
+        configured = self.timeouts.get(name, self.DEFAULT_TIMEOUT)
+        ema = self._latency_ema.get(name)
+        if ema is not None:
+            return min(configured, max(4.0 * ema, 2.0))
+        return configured
+
+    def _pool(self) -> ThreadPoolExecutor:
+        """
+        The shared worker pool, created on first use.
+
+        Deliberately never joined per call: a worker stuck past its
+        timeout is abandoned so it cannot block failover or a consensus
+        round.
+        """
+        if self._call_pool is None:
+            self._call_pool = ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="router"
+            )
+        return self._call_pool
+
+    def _call_with_timeout(
+        self,
+        name: str,
+        provider: LLMProvider,
+        prompt: str,
+        temperature: float
+    ) -> str:
+        """
+        Call a provider, aborting the wait at its timeout.
+
+        A stuck call raises TimeoutError (with the timeout in its
+        message - the bare futures version stringifies empty) into the
+        caller's existing exception handling so the chain moves on; the
+        worker thread is abandoned rather than blocking failover.
+
+        Args:
+            name: Provider name (for timeout lookup and latency stats)
+            provider: The provider instance
+            prompt: The input prompt
+            temperature: Sampling temperature
+
+        Returns:
+            Generated text response
+        """
+        started = time.monotonic()
+        future = self._pool().submit(
+            provider._cached_generate, prompt, temperature
+        )
+        timeout = self._timeout_for(name)
+        try:
+            result = future.result(timeout=timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise TimeoutError(f"timed out after {timeout}s") from None
+        self.record_latency(name, time.monotonic() - started)
+        return result
+
     def generate(
         self,
         prompt: str,
@@ -70,21 +198,46 @@ class Router:
         results = {}
 
         if strategy == RouterStrategy.CONSENSUS:
-            # Use top 3 available providers and return all results
-            count = 0
-            for name in self._get_provider_order(RouterStrategy.SMARTEST):
-                if name in self.providers and count < 3:
+            # Use top 3 available providers and return all results.
+            # The calls are independent, so they run in parallel and
+            # total latency is the slowest provider, not the sum
+            targets = [
+                (name, self.providers[name])
+                for name in self._ordered[RouterStrategy.SMARTEST][:3]
+            ]
+
+            if targets:
+                # Submit to the persistent pool: a context-managed pool
+                # would join its workers on exit, so one stuck provider
+                # would stall the whole round past its timeout
+                pool = self._pool()
+                started = time.monotonic()
+                futures = {
+                    pool.submit(provider._cached_generate, prompt, temperature): name
+                    for name, provider in targets
+                }
+                # Each wait's deadline is measured from round start, not
+                # from the wait's own start: time already spent awaiting
+                # earlier futures counts against it, bounding the round
+                # by the largest single timeout rather than their sum
+                for future, name in futures.items():
+                    timeout = self._timeout_for(name)
+                    remaining = max(0.0, started + timeout - time.monotonic())
                     try:
-                        results[name] = self.providers[name].generate(prompt, temperature)
-                        count += 1
+                        results[name] = future.result(timeout=remaining)
+                        self.record_latency(name, time.monotonic() - started)
+                    except FutureTimeout:
+                        future.cancel()
+                        results[name] = f"ERROR: timed out after {timeout}s"
                     except Exception as e:
+                        future.cancel()
                         results[name] = f"ERROR: {e}"
 
         elif strategy == RouterStrategy.FALLBACK:
             # Try providers in order until success
             for name, provider in self.providers.items():
                 try:
-                    result = provider.generate(prompt, temperature)
+                    result = self._call_with_timeout(name, provider, prompt, temperature)
                     results[name] = result
                     break  # Success, stop trying
                 except Exception as e:
@@ -92,34 +245,138 @@ class Router:
                     continue
 
         else:
-            # Single provider strategies (fastest, cheapest, smartest)
-            provider_order = self._get_provider_order(strategy)
+            # Single provider strategies (fastest, cheapest, smartest);
+            # unknown strategies fall back to configuration order
+            provider_order = self._ordered.get(strategy, tuple(self.providers))
             for name in provider_order:
-                if name in self.providers:
-                    try:
-                        results[name] = self.providers[name].generate(prompt, temperature)
-                        break  # Use first available
-                    except Exception:
-                        continue
+                try:
+                    results[name] = self._call_with_timeout(
+                        name, self.providers[name], prompt, temperature
+                    )
+                    break  # Use first available
+                except Exception:
+                    continue
 
         return results
 
-    def _get_provider_order(self, strategy: str) -> List[str]:
-        """Get provider order based on strategy."""
-        if strategy == RouterStrategy.FASTEST:
-            return self.rankings["speed"]
-        elif strategy == RouterStrategy.CHEAPEST:
-            return self.rankings["cost"]
-        elif strategy == RouterStrategy.SMARTEST:
-            return self.rankings["quality"]
+    async def agenerate(
+        self,
+        prompt: str,
+        temperature: float = 0.0,
+        strategy: str = RouterStrategy.FALLBACK
+    ) -> Dict[str, str]:
+        """
+        Async counterpart of generate.
+
+        Awaits provider agenerate calls directly on the event loop, so
+        adapters with native async clients never occupy a worker thread
+        and concurrent requests interleave freely.
+
+        Args:
+            prompt: The input prompt
+            temperature: Sampling temperature
+            strategy: Routing strategy to use
+
+        Returns:
+            Dictionary mapping provider names to their outputs
+        """
+        if strategy == RouterStrategy.CONSENSUS:
+            return await self.agenerate_consensus(prompt, temperature)
+
+        results: Dict[str, str] = {}
+
+        if strategy == RouterStrategy.FALLBACK:
+            for name, provider in self.providers.items():
+                started = time.monotonic()
+                timeout = self._timeout_for(name)
+                try:
+                    results[name] = await asyncio.wait_for(
+                        provider.agenerate(prompt, temperature),
+                        timeout=timeout
+                    )
+                    self.record_latency(name, time.monotonic() - started)
+                    break
+                except asyncio.TimeoutError:
+                    results[name] = f"ERROR: timed out after {timeout}s"
+                    continue
+                except Exception as e:
+                    results[name] = f"ERROR: {e}"
+                    continue
         else:
-            return list(self.providers.keys())
+            for name in self._ordered.get(strategy, tuple(self.providers)):
+                started = time.monotonic()
+                try:
+                    results[name] = await asyncio.wait_for(
+                        self.providers[name].agenerate(prompt, temperature),
+                        timeout=self._timeout_for(name)
+                    )
+                    self.record_latency(name, time.monotonic() - started)
+                    break
+                except Exception:
+                    continue
+
+        return results
+
+    async def agenerate_consensus(
+        self,
+        prompt: str,
+        temperature: float = 0.0
+    ) -> Dict[str, str]:
+        """
+        Query the top providers concurrently and return all results.
+
+        The calls run on the event loop via asyncio.gather, each bounded
+        by its own provider timeout; failures and timeouts are recorded
+        as ERROR strings so one slow provider never hides the rest.
+
+        Args:
+            prompt: The input prompt
+            temperature: Sampling temperature
+
+        Returns:
+            Dictionary mapping provider names to their outputs
+        """
+        targets = [
+            (name, self.providers[name])
+            for name in self._ordered[RouterStrategy.SMARTEST][:3]
+        ]
+        if not targets:
+            return {}
+
+        started = time.monotonic()
+
+        async def call(name: str, provider: LLMProvider) -> str:
+            timeout = self._timeout_for(name)
+            try:
+                text = await asyncio.wait_for(
+                    provider.agenerate(prompt, temperature),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                # asyncio.TimeoutError stringifies empty; raise one that
+                # produces a useful ERROR entry
+                raise TimeoutError(f"timed out after {timeout}s") from None
+            self.record_latency(name, time.monotonic() - started)
+            return text
+
+        outcomes = await asyncio.gather(
+            *(call(name, provider) for name, provider in targets),
+            return_exceptions=True
+        )
+
+        results: Dict[str, str] = {}
+        for (name, _), outcome in zip(targets, outcomes):
+            if isinstance(outcome, BaseException):
+                results[name] = f"ERROR: {outcome}"
+            else:
+                results[name] = outcome
+        return results
 
     def generate_primary(self, prompt: str, temperature: float = 0.0) -> str:
         """Generate from primary provider only."""
         if not self.primary:
             raise RuntimeError("No providers configured")
-        return self.providers[self.primary].generate(prompt, temperature)
+        return self.providers[self.primary]._cached_generate(prompt, temperature)
 
     def get_available_providers(self) -> List[str]:
         """Return list of available provider names."""